@@ -12,10 +12,16 @@ USAGE:
 
 import sys
 import argparse
+import copy
 import json
 from pathlib import Path
 from typing import Dict, Any, List
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -23,7 +29,7 @@ from scripts.docling_adapter import convert_pdf
 from scripts.grobid_tei import parse_article_metadata
 from scripts.grobid_client import Grobid
 from scripts.text_normalize import normalize_for_nlp, create_normalized_copy
-from scripts.stats_extractor import extract_statistics
+from scripts.stats_extractor import extract_statistics_from_paragraphs
 from scripts.figures import prepare_figures
 from scripts.ref_extract import extract_refs_from_tei
 from scripts.ref_enrich import enrich_references
@@ -33,58 +39,59 @@ from scripts.linking.linker_router import link_entities, link_entities_comparati
 from scripts.env_loader import load_env
 
 
-def process_with_linker(
-    pdf_path: Path,
-    linker: str,
-    grobid_url: str,
-    out_dir: Path
-) -> Path:
+def _load_json(path: Path) -> Dict[str, Any]:
+    """Parse a JSON file, preferring orjson when installed."""
+    raw = path.read_bytes()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def _dump_json(obj: Dict[str, Any], path: Path) -> None:
+    """Write pretty-printed JSON, preferring orjson when installed."""
+    if orjson:
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(obj, f, ensure_ascii=False, indent=2)
+
+
+def _extract_shared(pdf_path: Path, grobid_url: str, out_dir: Path) -> tuple:
     """
-    Process a PDF with a specific entity linker.
-    
-    Args:
-        pdf_path: Path to PDF file
-        linker: Linker to use ("umls", "quickumls", "scispacy")
-        grobid_url: GROBID service URL
-        out_dir: Output directory
-        
+    Run the linker-independent extraction phase (Docling, GROBID, references,
+    figures, statistics, cross-refs). Everything here is identical regardless
+    of which entity linker runs afterwards, so comparisons do it once.
+
     Returns:
-        Path to output JSON file
+        (doc, fulltext) — base document dict and the normalized fulltext
     """
-    print(f"\n{'='*60}")
-    print(f"Processing {pdf_path.name} with {linker.upper()} linker")
-    print(f"{'='*60}\n")
-    
     out_dir.mkdir(parents=True, exist_ok=True)
-    
+
     # Step 1: Extract structure with Docling
     print("1. Extracting document structure with Docling...")
     docling_data = convert_pdf(pdf_path)
-    
-    # Step 2: Get metadata from GROBID
+
+    # Step 2: Get metadata from GROBID (both calls in flight at once)
     print("2. Extracting metadata with GROBID...")
     grobid = Grobid(url=grobid_url)
-    tei_xml = grobid.process_fulltext(str(pdf_path))
-    refs_tei = grobid.process_biblio(str(pdf_path))
-    
+    tei_xml, refs_tei = grobid.process_both(str(pdf_path))
+
     # Parse metadata
     metadata = parse_article_metadata(tei_xml)
-    
+
     # Step 3: Extract references
     print("3. Extracting and enriching references...")
     references = extract_refs_from_tei(refs_tei)
     references_enriched = enrich_references(references)
-    
+
     # Step 4: Prepare figures
     print("4. Processing figures...")
-    fig_dir = out_dir / "figures" / linker
+    fig_dir = out_dir / "figures"
     figures = prepare_figures(
         docling_data.get("figures", []),
         fig_dir,
         base_name=pdf_path.stem,
         extract_text=True
     )
-    
+
     # Step 5: Build document structure
     doc = {
         "metadata": metadata,
@@ -96,11 +103,11 @@ def process_with_linker(
         "references": references,
         "references_enriched": references_enriched,
     }
-    
+
     # Step 6: Create normalized copy for NLP
     print("5. Normalizing text for NLP...")
     normalized_doc = create_normalized_copy(doc)
-    
+
     # Concatenate normalized text
     fulltext_parts = []
     for section in normalized_doc["structure"]["sections"]:
@@ -111,21 +118,30 @@ def process_with_linker(
                 fulltext_parts.append(para)
             elif isinstance(para, dict):
                 fulltext_parts.append(para.get("text", ""))
-    
+
+    # The concatenated fulltext is only needed by the cross-ref resolver and
+    # the entity linker; statistics run per paragraph so sentence splits
+    # never cross the section boundaries the join would erase.
     fulltext = "\n\n".join(fulltext_parts)
-    
-    # Step 7: Extract statistics (span-based)
+
+    # Step 7: Extract statistics (span-based, per paragraph)
     print("6. Extracting statistics...")
-    statistics = extract_statistics(fulltext)
+    statistics = extract_statistics_from_paragraphs(fulltext_parts)
     doc["statistics"] = statistics
-    
+
     # Step 8: Extract cross-references
     print("7. Extracting cross-references...")
     cross_refs = resolve_cross_refs(fulltext)
     section_refs = extract_cross_refs_from_sections(normalized_doc["structure"]["sections"])
     doc["cross_refs"] = cross_refs
     doc["section_cross_refs"] = section_refs
-    
+
+    return doc, fulltext
+
+
+def _link_and_save(doc: Dict[str, Any], fulltext: str, pdf_path: Path,
+                   linker: str, out_dir: Path) -> Path:
+    """Run the per-linker phase (entity linking, validation, save)."""
     # Step 9: Entity linking
     print(f"8. Linking entities with {linker.upper()}...")
     if linker == "scispacy":
@@ -134,26 +150,25 @@ def process_with_linker(
         method = "quickumls"
     else:
         method = "umls"
-    
+
     entities = link_entities(fulltext, method=method)
     doc["entities"] = entities
     doc["entity_linker"] = linker
-    
+
     # Step 10: Validation
     print("9. Validating extraction...")
     validation = validate_extraction(doc)
     doc["validation"] = validation
-    
+
     # Step 11: Save output
     out_path = out_dir / f"{pdf_path.stem}.{linker}.json"
     print(f"10. Saving to {out_path}")
-    
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(doc, f, ensure_ascii=False, indent=2)
-    
+
+    _dump_json(doc, out_path)
+
     # Print validation report
     print("\n" + generate_validation_report(validation))
-    
+
     # Print summary stats
     print(f"\nExtraction Summary:")
     print(f"  Sections: {len(doc['structure']['sections'])}")
@@ -163,32 +178,74 @@ def process_with_linker(
     print(f"  Entities: {len(doc['entities'])}")
     print(f"  Statistics: {len(doc['statistics'])}")
     print(f"  Cross-refs: {len(doc['cross_refs'])}")
-    
+
     return out_path
 
 
+def process_with_linker(
+    pdf_path: Path,
+    linker: str,
+    grobid_url: str,
+    out_dir: Path
+) -> Path:
+    """
+    Process a PDF with a specific entity linker.
+
+    Args:
+        pdf_path: Path to PDF file
+        linker: Linker to use ("umls", "quickumls", "scispacy")
+        grobid_url: GROBID service URL
+        out_dir: Output directory
+
+    Returns:
+        Path to output JSON file
+    """
+    print(f"\n{'='*60}")
+    print(f"Processing {pdf_path.name} with {linker.upper()} linker")
+    print(f"{'='*60}\n")
+
+    doc, fulltext = _extract_shared(pdf_path, grobid_url, out_dir)
+    return _link_and_save(doc, fulltext, pdf_path, linker, out_dir)
+
+
 def compare_linkers(pdf_path: Path, grobid_url: str, out_dir: Path) -> Dict[str, Path]:
     """
     Run all three linkers and save results.
-    
+
+    Docling/GROBID/statistics are linker-independent, so the extraction
+    phase runs once and only entity linking is repeated per linker.
+
     Args:
         pdf_path: Path to PDF file
         grobid_url: GROBID service URL
         out_dir: Output directory
-        
+
     Returns:
         Dict mapping linker name to output path
     """
     results = {}
-    
+
+    print(f"\n{'='*60}")
+    print(f"Extracting {pdf_path.name} (shared phase for all linkers)")
+    print(f"{'='*60}\n")
+    try:
+        shared_doc, fulltext = _extract_shared(pdf_path, grobid_url, out_dir)
+    except Exception as e:
+        print(f"Extraction failed: {e}")
+        return {linker: None for linker in ["umls", "quickumls", "scispacy"]}
+
     for linker in ["umls", "quickumls", "scispacy"]:
+        print(f"\n{'='*60}")
+        print(f"Linking {pdf_path.name} with {linker.upper()} linker")
+        print(f"{'='*60}\n")
         try:
-            out_path = process_with_linker(pdf_path, linker, grobid_url, out_dir)
+            out_path = _link_and_save(
+                copy.deepcopy(shared_doc), fulltext, pdf_path, linker, out_dir)
             results[linker] = out_path
         except Exception as e:
             print(f"Error with {linker}: {e}")
             results[linker] = None
-    
+
     return results
 
 
@@ -206,8 +263,7 @@ def compare_results(results: Dict[str, Path]) -> None:
     data = {}
     for linker, path in results.items():
         if path and path.exists():
-            with open(path, "r", encoding="utf-8") as f:
-                data[linker] = json.load(f)
+            data[linker] = _load_json(path)
     
     if not data:
         print("No results to compare")
@@ -0,0 +1,21 @@
+"""
+Regex engine shim: prefer the third-party `regex` module when installed.
+
+`regex` is a drop-in superset of stdlib `re` with a faster matcher and
+better literal-prefix analysis, which pays off in the modules that run
+patterns in tight inner loops (captions, UMLS linker, abstract fallback).
+Patterns compile under V1 semantics; stdlib `re` remains the fallback so
+nothing here is a hard dependency.
+"""
+try:
+    import regex as _engine
+    HAS_REGEX = True
+
+    def compile(pattern, flags=0):
+        return _engine.compile(pattern, flags | _engine.V1)
+except ImportError:
+    import re as _engine
+    HAS_REGEX = False
+
+    def compile(pattern, flags=0):
+        return _engine.compile(pattern, flags)
@@ -1,28 +1,83 @@
 import re
+import sys
+from bisect import bisect_left
 from typing import List, Dict, Tuple
 
-# Statistical cue words that must appear in the SAME sentence as any numeric pattern
-STAT_CUES = {
+# Interned result-type tags: hundreds of hits per paper share one string
+# object per kind instead of allocating a fresh one per record.
+TYPE_P_VALUE = sys.intern("p_value")
+TYPE_CI = sys.intern("ci")
+TYPE_MEAN_PLUSMINUS_SD = sys.intern("mean_plusminus_sd")
+TYPE_MEAN_SD = sys.intern("mean_sd")
+TYPE_EFFECT_SIZE = sys.intern("effect_size")
+
+# Optional DFA-backed regex engine (pyre2). RE2 scans without backtracking,
+# which is noticeably faster on the multi-pattern alternation below for large
+# fulltexts. Falls back to stdlib re when unavailable.
+try:
+    import re2 as _re2
+    HAS_RE2 = True
+except ImportError:
+    _re2 = None
+    HAS_RE2 = False
+
+
+def _compile_scan_pattern(pattern: str, flags: int = 0):
+    """Compile a scan-only pattern with RE2 when possible, else stdlib re."""
+    if HAS_RE2:
+        try:
+            return _re2.compile(pattern, flags)
+        except Exception:
+            pass  # pattern uses a construct RE2 rejects; use stdlib
+    return re.compile(pattern, flags)
+
+# Statistical cue words that must appear in the SAME sentence as any numeric
+# pattern. Compiled as an alternation of escaped LITERALS - no word
+# boundaries - so a hit means exactly what the old case-insensitive
+# substring test meant (including "or" inside "for", and "p=" but not
+# "p ="); cue detection is still a single C-level scan.
+STAT_CUES = (
     "ci", "confidence interval", "odds ratio", "or", "risk ratio", "rr",
     "hazard ratio", "hr", "p=", "p <", "p>", "p<", "p >", "mean", "median", "sd",
-    "standard deviation", "iqr", "interquartile", "±", "beta", "β"
-}
+    "standard deviation", "iqr", "interquartile", "±", "beta", "β",
+)
+RE_STAT_CUES = _compile_scan_pattern("|".join(map(re.escape, STAT_CUES)), re.I)
 
 RE_SENT_SPLIT = re.compile(r'(?<=[.!?])\s+(?=[A-Z(])')
 RE_HAS_LETTERS_AND_DIGITS = re.compile(r'(?=.*[A-Za-z])(?=.*\d)')
 RE_CITATION_TUPLE = re.compile(r'^\(\s*\d{1,3}(\s*,\s*\d{1,3})+\s*\)$')
 RE_GRANTISH = re.compile(r'[A-Za-z]\d[A-Za-z0-9-]+')  # e.g., U54HL119810-03
 
-# Selected stat patterns (keep conservative)
-RE_PVALUE = re.compile(r'\b[Pp]\s*([<=>])\s*0?\.\d+\b')
-RE_CI = re.compile(r'(?:(?:95|90|99)\s*%?\s*)?CI\s*[:=]?\s*[\(\[]?\s*(-?\d+(?:\.\d+)?)\s*[–—-]\s*(-?\d+(?:\.\d+)?)\s*[\)\]]?', re.I)
-RE_MEAN_SD = re.compile(r'\bmean\b[^.]*?\b(?:sd|standard deviation)\b[^.]*?(?:=|:)?\s*(-?\d+(?:\.\d+)?)[^.\d]+(\d+(?:\.\d+)?)', re.I)
-RE_PLUS_MINUS = re.compile(r'(-?\d+(?:\.\d+)?)\s*[±]\s*(\d+(?:\.\d+)?)')
-RE_EFFECT = re.compile(r'\b(?:OR|RR|HR)\b\s*(=|:)?\s*(-?\d+(?:\.\d+)?)')
+# Selected stat patterns (keep conservative). Deliberately NOT fused into
+# one alternation: the passes emit overlapping spans of different kinds -
+# "mean ± SD was 54.2 ± 9.1" must yield both a mean_plusminus_sd and a
+# mean_sd record - and a single alternation can only emit one match per
+# region. Each sentence is scanned once per pattern, in this order.
+RE_PVALUE = _compile_scan_pattern(r'\b[Pp]\s*([<=>])\s*0?\.\d+\b')
+RE_CI = _compile_scan_pattern(
+    r'(?:(?:95|90|99)\s*%?\s*)?CI\s*[:=]?\s*[\(\[]?\s*'
+    r'(-?\d+(?:\.\d+)?)\s*[–—-]\s*(-?\d+(?:\.\d+)?)\s*[\)\]]?', re.I)
+RE_MEAN_SD = _compile_scan_pattern(
+    r'\bmean\b[^.]*?\b(?:sd|standard deviation)\b[^.]*?'
+    r'(?:=|:)?\s*(-?\d+(?:\.\d+)?)[^.\d]+(\d+(?:\.\d+)?)', re.I)
+RE_PLUS_MINUS = _compile_scan_pattern(r'(-?\d+(?:\.\d+)?)\s*[±]\s*(\d+(?:\.\d+)?)')
+RE_EFFECT = _compile_scan_pattern(r'\b(?:OR|RR|HR)\b\s*(=|:)?\s*(-?\d+(?:\.\d+)?)')
+
+# Optional compiled accelerator (PyO3/Cython build of this module's loop).
+# Not shipped with the repo; if a _statistics_native extension is installed
+# alongside this package it takes over and the pure-Python path below stays
+# as the reference implementation and fallback.
+try:
+    from ._statistics_native import extract_statistics as _extract_statistics_native
+except ImportError:
+    _extract_statistics_native = None
 
 def _has_stat_cue(sentence: str) -> bool:
-    s = sentence.lower()
-    return any(cue in s for cue in STAT_CUES)
+    return RE_STAT_CUES.search(sentence) is not None
+
+def _cue_positions(text: str) -> List[int]:
+    """Start offsets of every stat cue, found in one pass over the full text."""
+    return [m.start() for m in RE_STAT_CUES.finditer(text)]
 
 def _is_grant_or_identifier(text: str) -> bool:
     # Only flag as grant if it matches the grant pattern specifically
@@ -33,81 +88,77 @@ def _is_pure_citation_tuple(token: str) -> bool:
     return bool(RE_CITATION_TUPLE.match(token.strip()))
 
 def _iter_sentences(text: str):
-    for chunk in RE_SENT_SPLIT.split(text):
-        yield chunk.strip()
+    """Yield (start, end, sentence) triples; the offsets bound the unstripped
+    region so they are computed once here rather than re-derived downstream."""
+    start = 0
+    for m in RE_SENT_SPLIT.finditer(text):
+        yield start, m.start(), text[start:m.start()].strip()
+        start = m.end()
+    yield start, len(text), text[start:].strip()
 
 def extract_statistics(text: str) -> List[Dict]:
     """
     Conservative, context-gated statistics extractor.
     Returns a list of dicts with keys: type, value(s), text, sentence, span.
     """
+    if _extract_statistics_native is not None:
+        return _extract_statistics_native(text)
     results: List[Dict] = []
-    offset = 0
-    for sent in _iter_sentences(text):
+
+    # One linear cue scan over the whole input; per-sentence cue presence is
+    # then a bisect over these offsets instead of a fresh scan per sentence.
+    cue_starts = _cue_positions(text)
+    if not cue_starts:
+        return results
+
+    for start, end, sent in _iter_sentences(text):
         if not sent:
-            offset += 1  # keep moving
             continue
 
-        # Hard negatives: grant-like or pure citations => skip unless we see cues
-        has_cue = _has_stat_cue(sent)
-        if not has_cue:
-            # If the entire sentence looks like a citation run or contains grant-like tokens, skip quickly.
-            if _is_grant_or_identifier(sent):
-                offset += len(sent) + 1
-                continue
-            # Drop (3,4) etc. with no cues
-            if _is_pure_citation_tuple(sent.strip()):
-                offset += len(sent) + 1
-                continue
+        # Cue gate: all patterns are cue-gated, so a sentence whose region
+        # holds no cue offset can never contribute a match.
+        lo = bisect_left(cue_starts, start)
+        if lo >= len(cue_starts) or cue_starts[lo] >= end:
+            continue
 
         # p-values
         for m in RE_PVALUE.finditer(sent):
-            if not has_cue:  # require cue for p-values too
-                continue
             results.append({
-                "type": "p_value", "value": m.group(0), "text": m.group(0),
+                "type": TYPE_P_VALUE, "value": m.group(0), "text": m.group(0),
                 "sentence": sent
             })
 
         # confidence intervals
         for m in RE_CI.finditer(sent):
-            if not has_cue:
-                continue
-            lo, hi = m.group(1), m.group(2)
             # sanity: reject if the matched window looks like an identifier
             if _is_grant_or_identifier(m.group(0)):
                 continue
             results.append({
-                "type": "ci", "value": [float(lo), float(hi)],
+                "type": TYPE_CI, "value": [float(m.group(1)), float(m.group(2))],
                 "text": m.group(0), "sentence": sent
             })
 
         # mean ± sd
         for m in RE_PLUS_MINUS.finditer(sent):
-            if not has_cue:
-                continue
             results.append({
-                "type": "mean_plusminus_sd", "value": [float(m.group(1)), float(m.group(2))],
+                "type": TYPE_MEAN_PLUSMINUS_SD,
+                "value": [float(m.group(1)), float(m.group(2))],
                 "text": m.group(0), "sentence": sent
             })
 
         # explicit mean/sd wording
         for m in RE_MEAN_SD.finditer(sent):
-            if not has_cue:
-                continue
             results.append({
-                "type": "mean_sd", "value": [float(m.group(1)), float(m.group(2))],
+                "type": TYPE_MEAN_SD,
+                "value": [float(m.group(1)), float(m.group(2))],
                 "text": m.group(0), "sentence": sent
             })
 
         # effect sizes OR/RR/HR
         for m in RE_EFFECT.finditer(sent):
-            if not has_cue:
-                continue
             results.append({
-                "type": "effect_size", "metric": m.group(0).split()[0],
+                "type": TYPE_EFFECT_SIZE, "metric": m.group(0).split()[0],
                 "value": float(m.group(2)), "text": m.group(0), "sentence": sent
             })
 
-        offset += len(sent) + 1
     return results
\ No newline at end of file
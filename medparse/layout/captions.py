@@ -1,54 +1,82 @@
 import re
+from bisect import bisect_right
 from typing import Dict, Any, List
 
-RE_TABLE_HDR = re.compile(r'^\s*Table\s+(\d+)\s*[:.]\s*(.+)', re.I)
-RE_FIG_HDR   = re.compile(r'^\s*Figure\s+(\d+)\s*[:.]\s*(.+)', re.I)
-RE_FOOTNOTE  = re.compile(r'^\s*([*†‡])\s+')
+from medparse import _re
 
-def _collect_caption(lines: List[str], start_idx: int) -> tuple[str, int]:
-    """Collect contiguous caption lines until blank or footnote marker."""
-    buf = []
-    i = start_idx
-    while i < len(lines):
-        line = lines[i].rstrip()
-        if not line or RE_FOOTNOTE.match(line):
-            break
-        buf.append(line)
-        i += 1
-    return (" ".join(buf).strip(), i)
+# Table and figure headers fused into one pattern so each line costs a
+# single regex dispatch; the kind is read off the named group. MULTILINE so
+# one finditer pass over the joined page text finds every header at once.
+RE_HDR = _re.compile(r'^\s*(?P<kind>Table|Figure)\s+(?P<num>\d+)\s*[:.]\s*(?P<rest>.+)', re.I | re.M)
+
+# Footnote lines open with a sigil FOLLOWED BY whitespace, as the old
+# RE_FOOTNOTE regex (^\s*([*†‡])\s+) required; a cheap character check
+# replaces the regex dispatch per caption line. The whitespace requirement
+# matters: significance lines like "*p<0.05 versus control" are caption
+# text, not footnotes.
+_FOOTNOTE_MARKERS = ('*', '†', '‡')
+
+def _is_footnote_line(line: str) -> bool:
+    s = line.lstrip()
+    return len(s) > 1 and s[0] in _FOOTNOTE_MARKERS and s[1].isspace()
 
 def attach_captions(pages: List[Dict[str, Any]], assets: Dict[str, Any]) -> None:
     """
     pages: list of { 'page_number': int, 'lines': [str, ...] }  # text lines in order
     assets: dict with 'tables' and 'figures', each item may have 'page' and will receive 'caption'/'footnote'
     """
-    # Build per-page captions registry from text
-    per_page_caps = {"table": {}, "figure": {}}
+    # Flatten all pages once; header detection is then a single C-level
+    # regex scan over the joined text instead of a Python match per line.
+    all_lines: List[str] = []
+    line_page: List[int] = []
     for p in pages:
-        lines = p.get("lines", [])
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-            m_t = RE_TABLE_HDR.match(line)
-            m_f = RE_FIG_HDR.match(line)
-            if m_t:
-                num = m_t.group(1)
-                cap, j = _collect_caption(lines, i)
-                per_page_caps["table"].setdefault(p["page_number"], {})[num] = {"caption": cap}
-                # collect footnote if any immediately after caption block
-                if j < len(lines) and RE_FOOTNOTE.match(lines[j]):
-                    per_page_caps["table"][p["page_number"]][num]["footnote"] = lines[j].strip()
-                i = j + 1
-                continue
-            if m_f:
-                num = m_f.group(1)
-                cap, j = _collect_caption(lines, i)
-                per_page_caps["figure"].setdefault(p["page_number"], {})[num] = {"caption": cap}
-                if j < len(lines) and RE_FOOTNOTE.match(lines[j]):
-                    per_page_caps["figure"][p["page_number"]][num]["footnote"] = lines[j].strip()
-                i = j + 1
+        page_number = p.get("page_number")
+        for line in p.get("lines", []):
+            all_lines.append(line)
+            line_page.append(page_number)
+
+    # Flat captions registry keyed by (kind, page, num): one hash lookup per
+    # probe instead of three nested dicts, and no inner-dict setdefaults.
+    caps: Dict[tuple, Dict[str, str]] = {}
+    if all_lines:
+        joined = "\n".join(all_lines)
+        # Cumulative start offset of each line, for offset -> line mapping.
+        line_starts = [0]
+        for ln in all_lines:
+            line_starts.append(line_starts[-1] + len(ln) + 1)
+
+        consumed_until = 0  # lines already absorbed into a caption block
+        for m in RE_HDR.finditer(joined):
+            # Map the Table/Figure keyword offset (not m.start(): the \s*
+            # prefix may span blank lines under re.M) back to its line.
+            idx = bisect_right(line_starts, m.start("kind")) - 1
+            if idx < consumed_until:
                 continue
-            i += 1
+            page = line_page[idx]
+            kind = m.group("kind").lower()
+            num = m.group("num")
+
+            # Collect contiguous caption lines on the same page until a
+            # blank line or footnote marker. Lines accumulate into one
+            # bytearray with space delimiters — a single growing buffer and
+            # one decode instead of an intermediate list plus join.
+            buf = bytearray()
+            j = idx
+            while j < len(all_lines) and line_page[j] == page:
+                line = all_lines[j].rstrip()
+                if not line or _is_footnote_line(line):
+                    break
+                if buf:
+                    buf.append(0x20)
+                buf.extend(line.encode("utf-8"))
+                j += 1
+
+            key = (kind, page, num)
+            caps[key] = {"caption": buf.decode("utf-8").strip()}
+            # collect footnote if any immediately after caption block
+            if j < len(all_lines) and line_page[j] == page and _is_footnote_line(all_lines[j]):
+                caps[key]["footnote"] = all_lines[j].strip()
+            consumed_until = j + 1
 
     # Attach to assets by matching on page + ordinal number if available
     for kind in ("tables", "figures"):
@@ -57,8 +85,8 @@ def attach_captions(pages: List[Dict[str, Any]], assets: Dict[str, Any]) -> None
             num  = str(item.get("number") or item.get("ordinal") or "")
             if not page or not num:
                 continue
-            bank = per_page_caps["table" if kind=="tables" else "figure"].get(page, {})
-            if num in bank:
-                item["caption"] = bank[num].get("caption")
-                if "footnote" in bank[num]:
-                    item["footnote"] = bank[num]["footnote"]
\ No newline at end of file
+            entry = caps.get(("table" if kind == "tables" else "figure", page, num))
+            if entry:
+                item["caption"] = entry.get("caption")
+                if "footnote" in entry:
+                    item["footnote"] = entry["footnote"]
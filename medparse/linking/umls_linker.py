@@ -1,17 +1,33 @@
 import re
-from typing import Iterable, List, Dict, Optional, Tuple, Set
+from functools import lru_cache
+from typing import Iterable, List, Dict, FrozenSet, Optional, Tuple, Set
 
-STOP_PHRASE_RE = re.compile(r'^(history|hx)\s+of\s+(one|two|three|four|five|six|seven|eight|nine|ten)\b', re.I)
-NON_ALPHA_RE = re.compile(r'^[^A-Za-z]*$')
+from medparse import _re
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Below this many candidates the NumPy array setup costs more than it saves.
+_VECTORIZE_THRESHOLD = 8
+
+STOP_PHRASE_RE = _re.compile(r'^(history|hx)\s+of\s+(one|two|three|four|five|six|seven|eight|nine|ten)\b', re.I)
+_SPLIT_RE = _re.compile(r'[^A-Za-z0-9]+')
+_STOP = frozenset({"of", "the", "a", "an", "and", "or", "to", "for", "in"})
 
 # Keep only useful UMLS semantic groups
 ALLOWED_SEM_GROUPS: Set[str] = {"DISO", "PROC", "ANAT", "CHEM"}  # adjust as needed
 
 def _normalize_tokens(text: str) -> List[str]:
-    return [t for t in re.split(r'[^A-Za-z0-9]+', text.lower()) if t and t not in {"of","the","a","an","and","or","to","for","in"}]
+    return [t for t in _SPLIT_RE.split(text.lower()) if t and t not in _STOP]
 
 def _valid_span_for_linking(text: str) -> bool:
-    if not text or NON_ALPHA_RE.match(text):
+    # Cheap rejects first: most invalid spans are empty/short or carry no
+    # letter at all, and neither needs the regex engine.
+    if len(text) < 3:
+        return False
+    if not any(c.isalpha() for c in text):
         return False
     if STOP_PHRASE_RE.match(text.strip()):
         return False
@@ -19,40 +35,153 @@ def _valid_span_for_linking(text: str) -> bool:
     # Require at least 2 content tokens or a long medical-ish token
     return len(toks) >= 2 or any(len(t) >= 6 for t in toks)
 
-def _overlap(a: List[str], b: List[str]) -> float:
-    sa, sb = set(a), set(b)
-    inter = len(sa & sb)
-    union = len(sa | sb) or 1
+@lru_cache(maxsize=200_000)
+def _tokset(text: str) -> FrozenSet[str]:
+    """Cached token set for a name/span string.
+
+    KB candidate names repeat heavily across spans within a document, so
+    memoizing by raw string means each unique name tokenizes once instead
+    of once per (span, candidate) pair.
+    """
+    return frozenset(_normalize_tokens(text))
+
+def _overlap(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    inter = len(a & b)
+    union = len(a | b) or 1
     return inter / union
 
+# Optional compiled overlap kernel. With tokenization memoized, the Jaccard
+# computation is the remaining per-candidate Python work; when numba is
+# installed it runs as a two-pointer merge over sorted int32 token ids
+# instead. The frozenset path above stays as reference and fallback.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None and np is not None:
+    @njit(cache=True)
+    def _jaccard_sorted(a, b):
+        i = 0
+        j = 0
+        inter = 0
+        while i < a.size and j < b.size:
+            if a[i] == b[j]:
+                inter += 1
+                i += 1
+                j += 1
+            elif a[i] < b[j]:
+                i += 1
+            else:
+                j += 1
+        union = a.size + b.size - inter
+        if union == 0:
+            return 0.0
+        return inter / union
+
+    _token_ids: Dict[str, int] = {}
+
+    @lru_cache(maxsize=200_000)
+    def _tokid_array(text: str):
+        """Sorted int32 token-id array for a string, for the jitted kernel."""
+        ids = {_token_ids.setdefault(t, len(_token_ids))
+               for t in _normalize_tokens(text)}
+        return np.array(sorted(ids), dtype=np.int32)
+else:
+    _jaccard_sorted = None
+    _tokid_array = None
+
 def link_umls_spans(
     spans: Iterable[Tuple[str, Tuple[int,int]]],
     *,
     kb_lookup,          # function(name) -> List[ { "cui":..., "name":..., "score":..., "semtypes":[...] } ]
+    kb_lookup_batch=None,  # optional function(names) -> List[List[Dict]], one call for all spans
     min_score: float = 0.85,
     min_overlap: float = 0.6
 ) -> List[Dict]:
     """
     Safer UMLS linker: applies span validity, candidate score cutoff,
     semantic group filter, and token-overlap.
+
+    When the KB layer exposes a batched entry point, pass it as
+    kb_lookup_batch: all unique valid span texts are resolved in one call,
+    amortizing per-call latency (network round-trips, ANN index setup).
     """
     out: List[Dict] = []
-    for text, (start, end) in spans:
-        if not _valid_span_for_linking(text):
+
+    # Gate validity first, then resolve candidates for the unique texts only;
+    # repeated surface forms share one lookup either way.
+    valid = [(text, span) for text, span in spans if _valid_span_for_linking(text)]
+    cand_by_text: Dict[str, List[Dict]] = {}
+    unique_texts: List[str] = []
+    for text, _ in valid:
+        if text not in cand_by_text:
+            cand_by_text[text] = []
+            unique_texts.append(text)
+    if kb_lookup_batch is not None:
+        for text, cands in zip(unique_texts, kb_lookup_batch(unique_texts)):
+            cand_by_text[text] = cands or []
+    else:
+        for text in unique_texts:
+            cand_by_text[text] = kb_lookup(text) or []
+
+    use_kernel = _jaccard_sorted is not None
+
+    # Identical surface forms ("COPD" thirty times in one paper) score once;
+    # every later occurrence reuses the memoized winner.
+    best_by_form: Dict[str, Optional[Dict]] = {}
+
+    for text, (start, end) in valid:
+        form = text.strip().lower()
+        if form in best_by_form:
+            best = best_by_form[form]
+            if best:
+                out.append({
+                    "text": text, "span": [start, end],
+                    "cui": best["cui"], "preferred_name": best.get("name"),
+                    "score": best.get("score"), "semtypes": best.get("semtypes", [])
+                })
             continue
-        cand_list = kb_lookup(text) or []
+        cand_list = cand_by_text[text]
+        span_toks = _tokid_array(text) if use_kernel else _tokset(text)
+
+        # Sort descending by score (stable, so ties keep caller order). The
+        # first candidate to clear every gate is then necessarily the best,
+        # letting the loop below exit without examining the rest.
+        cand_list = sorted(cand_list, key=lambda c: -c.get("score", 0.0))
+
+        # For large candidate lists, batch the score and semtype gates in
+        # NumPy so only survivors reach the (pricier) token-overlap pass.
+        if np is not None and len(cand_list) >= _VECTORIZE_THRESHOLD:
+            n = len(cand_list)
+            scores = np.fromiter(
+                (c.get("score", 0.0) for c in cand_list), dtype=np.float32, count=n)
+            sem_ok = np.fromiter(
+                ("semtypes" not in c or bool(set(c["semtypes"]) & ALLOWED_SEM_GROUPS)
+                 for c in cand_list),
+                dtype=bool, count=n)
+            candidate_idxs = np.flatnonzero((scores >= min_score) & sem_ok)
+        else:
+            candidate_idxs = range(len(cand_list))
+
         best: Optional[Dict] = None
-        span_toks = _normalize_tokens(text)
-        for cand in cand_list:
+        for i in candidate_idxs:
+            cand = cand_list[i]
             if cand.get("score", 0.0) < min_score:
                 continue
             if "semtypes" in cand and not set(cand["semtypes"]).intersection(ALLOWED_SEM_GROUPS):
                 continue
-            o = _overlap(span_toks, _normalize_tokens(cand.get("name","")))
+            name = cand.get("name", "")
+            if use_kernel:
+                o = _jaccard_sorted(span_toks, _tokid_array(name))
+            else:
+                o = _overlap(span_toks, _tokset(name))
             if o < min_overlap:
                 continue
-            if best is None or cand["score"] > best["score"]:
-                best = cand
+            # Candidates are score-descending, so the first acceptance wins.
+            best = cand
+            break
+        best_by_form[form] = best
         if best:
             out.append({
                 "text": text, "span": [start, end],
@@ -5,6 +5,56 @@ Scans first 2 pages for "Abstract" section and captures until Introduction/Keywo
 import re
 from typing import Dict, Any, Optional
 
+from medparse import _re
+
+# Section-title and line patterns, compiled once at import. Each former
+# pattern list is collapsed into a single alternation so a title costs one
+# match call instead of one per pattern; re.I replaces per-title .lower().
+_ABSTRACT_RE = _re.compile(r'^(?:abstract|summary|synopsis|overview)\s*$', re.I)
+_STOP_RE = _re.compile(
+    r'^(?:introduction|keywords?|key\s*words|background|methods|materials'
+    r'|1\.\s*introduction|i\.\s*introduction)', re.I)
+_ABSTRACT_WORD_RE = _re.compile(r'^abstract\b', re.I)
+_ABSTRACT_PREFIX_RE = _re.compile(r'^abstract\s*:\s*', re.I)
+_KW_LINE_RE = _re.compile(r'^keywords?\s*:', re.I)
+_META_STOP_RE = _re.compile(r'^(?:keywords?|introduction|background|methods)\s*:', re.I)
+_WS_RE = _re.compile(r'\s+')
+_TRIM_RE = _re.compile(r'^\W+|\W+$')
+
+# Abstracts live at the front of a paper; scanning past the first few
+# sections only costs time on documents that have no abstract at all.
+MAX_SECTIONS_TO_SCAN = 8
+
+# The final length gate discards abstracts of 5000+ chars, so collection
+# can stop as soon as that much text has accumulated.
+MAX_ABSTRACT_CHARS = 5000
+
+# First-token prefilter for section titles. Almost every real section is
+# neither an abstract nor a stop heading, so one dict lookup on the first
+# token screens it out before any regex runs; the regexes only confirm
+# anchoring/wording when the prefilter fires.
+_TITLE_PREFILTER = {
+    "abstract": "A", "summary": "A", "synopsis": "A", "overview": "A",
+    "introduction": "S", "keywords": "S", "keyword": "S", "key": "S",
+    "background": "S", "methods": "S", "materials": "S", "1": "S", "i": "S",
+}
+
+def _para_text(p) -> str:
+    """Flatten a dict-or-str paragraph entry to stripped text."""
+    return (p.get("text", "") if isinstance(p, dict) else str(p)).strip()
+
+def _classify_title(title: str) -> str:
+    """Classify a section title: 'A' abstract, 'S' stop heading, '' other."""
+    if not title:
+        return ""
+    first = title.split(None, 1)[0].rstrip(':.').lower()
+    tag = _TITLE_PREFILTER.get(first)
+    if tag == "A" and _ABSTRACT_RE.match(title):
+        return "A"
+    if tag == "S" and _STOP_RE.match(title):
+        return "S"
+    return ""
+
 def extract_abstract(doc: Dict[str, Any]) -> Optional[str]:
     """
     Extract abstract from document structure.
@@ -24,113 +74,77 @@ def extract_abstract(doc: Dict[str, Any]) -> Optional[str]:
     if not sections:
         return None
     
+    # Normalize once up front: every paragraph becomes plain stripped text,
+    # so the loops below never repeat the dict-or-str dispatch or re-fetch
+    # "paragraphs" per branch.
+    sections_norm = [
+        (s.get("title", "").strip(), [_para_text(p) for p in s.get("paragraphs", [])])
+        for s in sections
+    ]
+
     abstract_text = []
+    collected_len = 0
     found_abstract = False
-    
-    # Common abstract section titles
-    abstract_patterns = [
-        r'^abstract\s*$',
-        r'^summary\s*$',
-        r'^synopsis\s*$',
-        r'^overview\s*$'
-    ]
-    
-    # Stop when we hit these sections
-    stop_patterns = [
-        r'^introduction',
-        r'^keywords',
-        r'^key\s*words',
-        r'^background',
-        r'^methods',
-        r'^materials',
-        r'^1\.\s*introduction',
-        r'^i\.\s*introduction'
-    ]
-    
-    for section in sections:
-        title = section.get("title", "").strip().lower()
-        
+
+    for title, paras in sections_norm[:MAX_SECTIONS_TO_SCAN]:
+        tag = _classify_title(title)
+
         # Check if this is the abstract section
         if not found_abstract:
-            for pattern in abstract_patterns:
-                if re.match(pattern, title):
-                    found_abstract = True
-                    break
-            
+            if tag == "A":
+                found_abstract = True
+
             # Also check if abstract is in the first untitled section
             if not found_abstract and not title:
                 # Check first paragraph for "Abstract" label
-                paragraphs = section.get("paragraphs", [])
-                if paragraphs:
-                    first_text = ""
-                    if isinstance(paragraphs[0], dict):
-                        first_text = paragraphs[0].get("text", "")
-                    else:
-                        first_text = str(paragraphs[0])
-                    
-                    if re.match(r'^abstract\b', first_text.lower()):
-                        found_abstract = True
-                        # Skip the "Abstract" label itself
-                        if len(paragraphs) > 1:
-                            paragraphs = paragraphs[1:]
-        
+                if paras and _ABSTRACT_WORD_RE.match(paras[0]):
+                    found_abstract = True
+
         # If we found abstract, collect text
         if found_abstract:
             # Check if we should stop
-            should_stop = False
-            for pattern in stop_patterns:
-                if re.match(pattern, title):
-                    should_stop = True
-                    break
-            
+            should_stop = tag == "S"
+
             if should_stop and abstract_text:
                 # We've collected abstract and hit next section
                 break
-            
+
             # Collect paragraphs
             if not should_stop or not abstract_text:
-                paragraphs = section.get("paragraphs", [])
-                for para in paragraphs:
-                    if isinstance(para, dict):
-                        text = para.get("text", "").strip()
-                    else:
-                        text = str(para).strip()
-                    
+                for text in paras:
                     if text:
                         # Skip if this looks like a keyword line
-                        if re.match(r'^keywords?\s*:', text.lower()):
+                        if _KW_LINE_RE.match(text):
                             break
                         abstract_text.append(text)
-                
+                        collected_len += len(text)
+                if collected_len > MAX_ABSTRACT_CHARS:
+                    # Already over the length gate; more text cannot help
+                    break
+
                 # Only check first 2-3 sections after finding abstract
                 if len(abstract_text) > 0 and title:
                     # If we have a titled section after abstract, might be done
-                    if not any(re.match(p, title) for p in abstract_patterns):
+                    if tag != "A":
                         break
     
     # Alternative: Look for abstract in metadata-like first section
-    if not abstract_text and sections:
+    if not abstract_text and sections_norm:
         # Check first section for abstract-like content
-        first_section = sections[0]
-        paragraphs = first_section.get("paragraphs", [])
-        
+        _, first_paras = sections_norm[0]
+
         in_abstract = False
-        for para in paragraphs[:20]:  # Check first 20 paragraphs
-            if isinstance(para, dict):
-                text = para.get("text", "").strip()
-            else:
-                text = str(para).strip()
-            
+        for text in first_paras[:20]:  # Check first 20 paragraphs
             # Look for Abstract: or ABSTRACT: prefix
-            if re.match(r'^abstract\s*:\s*', text.lower()):
+            if _ABSTRACT_PREFIX_RE.match(text):
                 in_abstract = True
                 # Remove the prefix
-                text = re.sub(r'^abstract\s*:\s*', '', text, flags=re.IGNORECASE).strip()
+                text = _ABSTRACT_PREFIX_RE.sub('', text).strip()
                 if text:
                     abstract_text.append(text)
             elif in_abstract:
                 # Stop at keywords or next section
-                if re.match(r'^(keywords?|introduction|background|methods)\s*:', text.lower()):
+                if _META_STOP_RE.match(text):
                     break
                 if text:
                     abstract_text.append(text)
@@ -140,8 +154,8 @@ def extract_abstract(doc: Dict[str, Any]) -> Optional[str]:
         full_abstract = " ".join(abstract_text)
         
         # Clean up common artifacts
-        full_abstract = re.sub(r'\s+', ' ', full_abstract)  # Normalize whitespace
-        full_abstract = re.sub(r'^\W+|\W+$', '', full_abstract)  # Trim punctuation
+        full_abstract = _WS_RE.sub(' ', full_abstract)  # Normalize whitespace
+        full_abstract = _TRIM_RE.sub('', full_abstract)  # Trim punctuation
         
         # Ensure reasonable length (not too short, not entire paper)
         if 50 < len(full_abstract) < 5000:
@@ -149,30 +163,43 @@ def extract_abstract(doc: Dict[str, Any]) -> Optional[str]:
     
     return None
 
+# Two-phase raw-text scan: find the abstract heading first, then look for a
+# stop keyword on a bounded slice after it. Avoids the lazy DOTALL
+# alternation whose backtracking is quadratic on long non-matching inputs.
+_ABS_ANCHOR_RE = _re.compile(r'(?:^|\n)\s*(?:ABSTRACT|Abstract|Summary)\s*[\n:]\s*')
+_ABS_STOP_RE = _re.compile(
+    r'\n\s*(?:Keywords?|KEYWORDS?|Introduction|INTRODUCTION'
+    r'|Background|BACKGROUND|1\.\s*Introduction)')
+
 def extract_abstract_from_raw_text(text: str) -> Optional[str]:
     """
     Fallback: Extract abstract from raw text using patterns.
-    
+
     Args:
         text: Raw document text
-        
+
     Returns:
         Abstract if found
     """
-    # Look for abstract section
-    abstract_match = re.search(
-        r'(?:^|\n)\s*(?:ABSTRACT|Abstract|Summary)\s*[\n:]\s*(.+?)(?=\n\s*(?:Keywords?|KEYWORDS?|Introduction|INTRODUCTION|Background|BACKGROUND|1\.\s*Introduction))',
-        text,
-        re.DOTALL | re.MULTILINE
-    )
-    
-    if abstract_match:
-        abstract = abstract_match.group(1).strip()
-        # Clean up
-        abstract = re.sub(r'\s+', ' ', abstract)
-        abstract = re.sub(r'^\W+|\W+$', '', abstract)
-        
-        if 50 < len(abstract) < 5000:
-            return abstract
-    
+    # Phase 1: locate the abstract heading
+    anchor = _ABS_ANCHOR_RE.search(text)
+    if not anchor:
+        return None
+
+    # Phase 2: find the earliest stop keyword on a bounded slice, so the
+    # regex never walks more than a few KB regardless of document length.
+    # No stop keyword means no abstract, as in the one-pass pattern.
+    tail = text[anchor.end():anchor.end() + 8000]
+    stop = _ABS_STOP_RE.search(tail)
+    if not stop:
+        return None
+    abstract = tail[:stop.start()]
+
+    # Clean up
+    abstract = _WS_RE.sub(' ', abstract.strip())
+    abstract = _TRIM_RE.sub('', abstract)
+
+    if 50 < len(abstract) < 5000:
+        return abstract
+
     return None
\ No newline at end of file
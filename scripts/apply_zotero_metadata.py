@@ -2,13 +2,18 @@
 import argparse
 import csv
 import json
+import mmap
 import os
+import re
+import shutil
 import sys
 import unicodedata
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 # Ensure project root on path
 ROOT = Path(__file__).resolve().parents[1]
@@ -17,6 +22,67 @@ if str(ROOT) not in sys.path:
 
 from scripts.util.provenance import add_patch  # type: ignore
 
+# orjson parses and serializes severalfold faster than stdlib json and
+# round-trips thousands of extracted files here; stdlib is the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _load_json(path: Path) -> Any:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _dump_json(obj: Any, path: Path) -> None:
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        # Stream with json.dump rather than dumps+write_text: no full-document
+        # str intermediate, so peak memory during the write is halved.
+        with path.open("w", encoding="utf-8", buffering=1 << 20) as f:
+            json.dump(obj, f, ensure_ascii=False, indent=2)
+
+
+# Streaming CSL-JSON parse: ijson yields one item at a time, so a large
+# Zotero library never materializes twice (full dict tree + CSLItems).
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+# Optional MinHash/LSH prefilter for fuzzy title matching. Without it the
+# fuzzy phase compares every input title against every CSL item; with it
+# the LSH shortlist skips the vast majority of pairs that share no tokens.
+try:
+    from datasketch import MinHash, MinHashLSH
+except ImportError:
+    MinHash = None
+    MinHashLSH = None
+
+# Optional vectorized Jaccard: all CSL titles as one CSR boolean matrix so a
+# query costs a single sparse matrix-vector product instead of a Python loop.
+try:
+    import numpy as np
+    from scipy import sparse
+except ImportError:
+    np = None
+    sparse = None
+
+# Preferred fuzzy scorer: RapidFuzz runs token_set_ratio in C++ over the
+# whole choices list per query, replacing the Python set-Jaccard entirely.
+try:
+    from rapidfuzz import fuzz as rf_fuzz
+    from rapidfuzz import process as rf_process
+except ImportError:
+    rf_fuzz = None
+    rf_process = None
+
+_NUM_PERM = 128
+
 
 def log_manual_patch(prov: Dict[str, Any], path: str, old: Any, new: Any, note: str) -> None:
     prov.setdefault("patches", []).append({
@@ -30,26 +96,25 @@ def log_manual_patch(prov: Dict[str, Any], path: str, old: Any, new: Any, note:
     })
 
 
+_NORM_RE = re.compile(r"[^0-9a-z]+")
+
+
 def norm_text(s: str) -> str:
     if not s:
         return ""
-    s = unicodedata.normalize("NFKD", s)
-    s = s.lower()
-    out = []
-    prev_space = False
-    for ch in s:
-        if ch.isalnum():
-            out.append(ch)
-            prev_space = False
-        else:
-            if not prev_space:
-                out.append(" ")
-                prev_space = True
-    return " ".join("".join(out).split())
+    # ASCII-only strings (the common case for these titles) are already
+    # NFKD-normalized, so the normalize call can be skipped outright.
+    if not s.isascii():
+        s = unicodedata.normalize("NFKD", s)
+    return _NORM_RE.sub(" ", s.lower()).strip()
 
 
-def token_set(s: str) -> set:
-    return set(t for t in norm_text(s).split() if len(t) >= 2)
+@lru_cache(maxsize=None)
+def token_set(s: str) -> FrozenSet[str]:
+    # Memoized: titles repeat across the corpus and across query retries,
+    # so each unique string tokenizes once. Frozen so the value is safely
+    # shared between cache hits.
+    return frozenset(t for t in norm_text(s).split() if len(t) >= 2)
 
 
 def jaccard(a: set, b: set) -> float:
@@ -62,19 +127,17 @@ def jaccard(a: set, b: set) -> float:
     return inter / union if union else 0.0
 
 
+_YEAR_RE = re.compile(r"(?:19|20)\d{2}")
+
+
 def parse_year_int(y: Any) -> Optional[int]:
-    try:
-        s = str(y)
-        for i in range(len(s) - 3):
-            sub = s[i : i + 4]
-            if sub.isdigit() and sub.startswith(("19", "20")):
-                return int(sub)
-    except Exception:
+    if y is None:
         return None
-    return None
+    m = _YEAR_RE.search(str(y))
+    return int(m.group(0)) if m else None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CSLItem:
     id: Optional[str]
     title: str
@@ -91,76 +154,99 @@ class CSLItem:
     authors: List[str]
 
 
-def load_csl_json(path: Path) -> List[CSLItem]:
-    data = json.loads(path.read_text(encoding="utf-8"))
-    items: List[CSLItem] = []
-    for it in data:
-        title = it.get("title") or ""
-        tnorm = norm_text(title)
-        year = None
-        issued = it.get("issued") or {}
-        dps = issued.get("date-parts") or []
-        if dps and isinstance(dps, list) and dps[0]:
-            try:
-                year = int(dps[0][0])
-            except Exception:
-                year = None
-        doi = (it.get("DOI") or it.get("doi") or None)
-        cont = it.get("container-title") or it.get("container_title") or None
-        issn = it.get("ISSN") or it.get("issn") or None
-        authors: List[str] = []
-        for a in it.get("author") or []:
-            if isinstance(a, dict):
-                given = (a.get("given") or "").strip()
-                family = (a.get("family") or "").strip()
-                literal = (a.get("literal") or "").strip()
-                if given or family:
-                    authors.append((given + " " + family).strip())
-                elif literal:
-                    authors.append(literal)
-        items.append(
-            CSLItem(
-                id=(it.get("id") or None),
-                title=title,
-                title_norm=tnorm,
-                doi=(doi.lower() if isinstance(doi, str) else None),
-                container_title=(cont if isinstance(cont, str) else None),
-                abstract=(it.get("abstract") or None),
-                volume=(str(it.get("volume")) if it.get("volume") is not None else None),
-                issue=(str(it.get("issue")) if it.get("issue") is not None else None),
-                pages=(it.get("page") or it.get("pages") or None),
-                issn=(issn if isinstance(issn, str) else None),
-                url=(it.get("URL") or it.get("url") or None),
-                year=year,
-                authors=authors,
-            )
-        )
-    return items
+def _build_csl(it: Dict[str, Any]) -> CSLItem:
+    title = it.get("title") or ""
+    tnorm = norm_text(title)
+    year = None
+    issued = it.get("issued") or {}
+    dps = issued.get("date-parts") or []
+    if dps and isinstance(dps, list) and dps[0]:
+        try:
+            year = int(dps[0][0])
+        except Exception:
+            year = None
+    doi = (it.get("DOI") or it.get("doi") or None)
+    cont = it.get("container-title") or it.get("container_title") or None
+    issn = it.get("ISSN") or it.get("issn") or None
+    authors: List[str] = []
+    for a in it.get("author") or []:
+        if isinstance(a, dict):
+            given = (a.get("given") or "").strip()
+            family = (a.get("family") or "").strip()
+            literal = (a.get("literal") or "").strip()
+            if given or family:
+                authors.append((given + " " + family).strip())
+            elif literal:
+                authors.append(literal)
+    return CSLItem(
+        id=(it.get("id") or None),
+        title=title,
+        title_norm=tnorm,
+        doi=(doi.lower() if isinstance(doi, str) else None),
+        container_title=(cont if isinstance(cont, str) else None),
+        abstract=(it.get("abstract") or None),
+        volume=(str(it.get("volume")) if it.get("volume") is not None else None),
+        issue=(str(it.get("issue")) if it.get("issue") is not None else None),
+        pages=(it.get("page") or it.get("pages") or None),
+        issn=(issn if isinstance(issn, str) else None),
+        url=(it.get("URL") or it.get("url") or None),
+        year=year,
+        authors=authors,
+    )
 
 
-@dataclass
+def load_csl_json(path: Path) -> List[CSLItem]:
+    # With ijson, items stream out of the file one at a time and each parsed
+    # dict is dropped as soon as its CSLItem is built; the fallbacks
+    # materialize the whole export, via mmap (no intermediate bytes copy)
+    # when orjson can parse a buffer directly.
+    if ijson is not None:
+        with open(path, "rb") as f:
+            return [_build_csl(it) for it in ijson.items(f, "item")]
+    if orjson is not None and path.stat().st_size > 0:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # memoryview: orjson wants a buffer type, not the mmap itself
+            data = orjson.loads(memoryview(mm))
+        return [_build_csl(it) for it in data]
+    return [_build_csl(it) for it in _load_json(path)]
+
+
+@dataclass(slots=True, frozen=True)
 class CSVInfo:
     key: Optional[str]
     pdf_basenames: List[str]
     title_norm: Optional[str]
 
 
-def load_zotero_csv(path: Path) -> Dict[str, CSVInfo]:
+def _resolve_col(idx: Dict[str, int], *names: str) -> Optional[int]:
+    for name in names:
+        if name in idx:
+            return idx[name]
+    return None
+
+
+def load_zotero_csv(path: Path) -> Tuple[Dict[str, CSVInfo], Dict[str, CSVInfo]]:
+    """Returns (csvmap keyed by Zotero key/title, csv_by_titlenorm). The
+    second map replaces the per-file linear scan over csvmap.values()."""
     out: Dict[str, CSVInfo] = {}
-    with path.open(newline="", encoding="utf-8") as f:
-        r = csv.DictReader(f)
+    by_titlenorm: Dict[str, CSVInfo] = {}
+    # csv.reader with column indices resolved once from the header; avoids
+    # DictReader's per-row dict build and repeated .get() fallbacks.
+    with open(path, newline="", encoding="utf-8", buffering=1 << 20) as f:
+        r = csv.reader(f)
+        header = next(r, None)
+        if header is None:
+            return out, by_titlenorm
+        idx = {name: i for i, name in enumerate(header)}
+        key_i = _resolve_col(idx, "Key", "key", "ID", "Id")
+        title_i = _resolve_col(idx, "Title", "title")
+        attach_i = _resolve_col(idx, "File Attachments", "Attachments", "File", "file")
         for row in r:
-            # Columns vary; handle common cases
-            key = (row.get("Key") or row.get("key") or row.get("ID") or row.get("Id") or "").strip() or None
-            title = (row.get("Title") or row.get("title") or "").strip()
+            n = len(row)
+            key = (row[key_i].strip() if key_i is not None and key_i < n else "") or None
+            title = row[title_i].strip() if title_i is not None and title_i < n else ""
             tnorm = norm_text(title) if title else None
-            attachments = (
-                row.get("File Attachments")
-                or row.get("Attachments")
-                or row.get("File")
-                or row.get("file")
-                or ""
-            )
+            attachments = row[attach_i] if attach_i is not None and attach_i < n else ""
             pdfs: List[str] = []
             if attachments:
                 parts = [p.strip() for p in attachments.split(";") if p.strip()]
@@ -171,8 +257,13 @@ def load_zotero_csv(path: Path) -> Dict[str, CSVInfo]:
                         pdfs.append(base)
             if key or tnorm:
                 out_key = key or (tnorm or "")
-                out[out_key] = CSVInfo(key=key, pdf_basenames=pdfs, title_norm=tnorm)
-    return out
+                info = CSVInfo(key=key, pdf_basenames=pdfs, title_norm=tnorm)
+                out[out_key] = info
+                if tnorm:
+                    # setdefault keeps the first row per title, matching the
+                    # old first-hit linear scan.
+                    by_titlenorm.setdefault(tnorm, info)
+    return out, by_titlenorm
 
 
 def first_author_last_from_json(md_authors: Any) -> Optional[str]:
@@ -193,9 +284,8 @@ def first_author_last_from_json(md_authors: Any) -> Optional[str]:
     return None
 
 
-def merge_fields(obj: dict, csl: CSLItem, csvinfo: Optional[CSVInfo], match_method: str, confidence: Optional[float]) -> Tuple[dict, List[str]]:
+def merge_fields(obj: dict, csl: CSLItem, csvinfo: Optional[CSVInfo], match_method: str, confidence: Optional[float], now_iso: str) -> Tuple[dict, List[str]]:
     changed_fields: List[str] = []
-    now_iso = datetime.utcnow().isoformat() + "Z"
     md = obj.setdefault("metadata", {})
 
     def set_field(path: str, key: str, new_val: Any, source: str):
@@ -260,19 +350,439 @@ def merge_fields(obj: dict, csl: CSLItem, csvinfo: Optional[CSVInfo], match_meth
     return obj, changed_fields
 
 
+def _minhash(tokens: set) -> "MinHash":
+    mh = MinHash(num_perm=_NUM_PERM)
+    for t in tokens:
+        mh.update(t.encode("utf-8"))
+    return mh
+
+
+@dataclass(slots=True)
+class FuzzyIndex:
+    token_sets: List[set]
+    choices: List[str]       # normalized titles, for the RapidFuzz scorer
+    lsh: Any = None
+    vocab: Optional[Dict[str, int]] = None
+    matrix: Any = None       # CSR bool matrix, rows=items, cols=vocab
+    row_sums: Any = None     # per-item token count
+
+
+def build_fuzzy_index(csl_items: List[CSLItem], threshold: float) -> FuzzyIndex:
+    """Precompute per-item title token sets plus whichever accelerators the
+    environment offers: a SciPy CSR token-incidence matrix (vectorized
+    Jaccard against the whole corpus in one SpMV), and/or a MinHashLSH
+    shortlist when datasketch is installed and the threshold is high
+    enough for LSH to be reliable."""
+    token_sets = [token_set(it.title) for it in csl_items]
+    idx = FuzzyIndex(token_sets=token_sets,
+                     choices=[it.title_norm for it in csl_items])
+    if rf_process is not None:
+        return idx  # RapidFuzz path needs no further index structures
+
+    if sparse is not None and token_sets:
+        vocab: Dict[str, int] = {}
+        rows: List[int] = []
+        cols: List[int] = []
+        for i, toks in enumerate(token_sets):
+            for t in toks:
+                rows.append(i)
+                cols.append(vocab.setdefault(t, len(vocab)))
+        if vocab:
+            idx.vocab = vocab
+            idx.matrix = sparse.csr_matrix(
+                (np.ones(len(rows), dtype=np.int32), (rows, cols)),
+                shape=(len(token_sets), len(vocab)),
+            )
+            idx.row_sums = np.asarray(idx.matrix.sum(axis=1)).ravel()
+
+    if idx.matrix is None and MinHashLSH is not None and threshold >= 0.5:
+        lsh = MinHashLSH(threshold=threshold, num_perm=_NUM_PERM)
+        for i, toks in enumerate(token_sets):
+            if toks:
+                lsh.insert(str(i), _minhash(toks))
+        idx.lsh = lsh
+    return idx
+
+
+def best_fuzzy_match(
+    title: str,
+    csl_items: List[CSLItem],
+    idx: FuzzyIndex,
+    cand_idxs: Optional[List[int]] = None,
+) -> Tuple[Optional[CSLItem], float]:
+    """Best fuzzy match for a title. Prefers RapidFuzz token_set_ratio
+    (C++ scorer over the whole choices list), then the sparse-matrix
+    Jaccard path (one C-level SpMV over the corpus), then the LSH
+    shortlist; the pure-Python set scan is the fallback and reference.
+
+    cand_idxs optionally restricts scoring to those item indices (the
+    publication-year window computed by the caller)."""
+    a = token_set(title)
+    if not a:
+        return None, 0.0
+
+    if rf_process is not None:
+        if cand_idxs is not None:
+            choices = [idx.choices[i] for i in cand_idxs]
+        else:
+            choices = idx.choices
+        hit = rf_process.extractOne(
+            norm_text(title), choices, scorer=rf_fuzz.token_set_ratio)
+        if hit is None:
+            return None, 0.0
+        _, score, i = hit
+        if cand_idxs is not None:
+            i = cand_idxs[i]
+        # token_set_ratio is 0-100; callers threshold on a 0-1 min_fuzzy.
+        return csl_items[i], score / 100.0
+
+    if idx.matrix is not None:
+        q = np.zeros(len(idx.vocab), dtype=np.int32)
+        for t in a:
+            col = idx.vocab.get(t)
+            if col is not None:
+                q[col] = 1
+        matrix, row_sums = idx.matrix, idx.row_sums
+        if cand_idxs is not None:
+            matrix = matrix[cand_idxs]
+            row_sums = row_sums[cand_idxs]
+        inter = matrix @ q
+        # len(a), not q.sum(): query tokens outside the vocab still count
+        # toward the union even though they can never intersect.
+        union = row_sums + len(a) - inter
+        sims = inter / np.maximum(union, 1)
+        i = int(sims.argmax())
+        score = float(sims[i])
+        if cand_idxs is not None:
+            i = cand_idxs[i]
+        return csl_items[i], score
+
+    if idx.lsh is not None:
+        cand: Any = [int(k) for k in idx.lsh.query(_minhash(a))]
+        if cand_idxs is not None:
+            allowed = set(cand_idxs)
+            cand = [i for i in cand if i in allowed]
+    elif cand_idxs is not None:
+        cand = cand_idxs
+    else:
+        cand = range(len(csl_items))
+    best: Tuple[Optional[CSLItem], float] = (None, 0.0)
+    for i in cand:
+        s = jaccard(a, idx.token_sets[i])
+        if s > best[1]:
+            best = (csl_items[i], s)
+    return best
+
+
+def _prefer(a: CSLItem, b: CSLItem) -> CSLItem:
+    """Pick the better of two items colliding on an index key: one with a
+    DOI beats one without, then the newer year, then the earlier insert."""
+    if (a.doi is None) != (b.doi is None):
+        return a if a.doi else b
+    if (a.year or 0) != (b.year or 0):
+        return a if (a.year or 0) > (b.year or 0) else b
+    return a
+
+
 def build_indices(csl_items: List[CSLItem]):
+    # by_title/by_auth_year store a single item per key (only the first of
+    # each duplicate list was ever used); collisions resolve via _prefer.
     by_doi: Dict[str, CSLItem] = {}
-    by_title: Dict[str, List[CSLItem]] = {}
-    by_auth_year: Dict[str, List[CSLItem]] = {}
-    for it in csl_items:
+    by_title: Dict[str, CSLItem] = {}
+    by_auth_year: Dict[str, CSLItem] = {}
+    by_year: Dict[int, List[int]] = {}
+    for i, it in enumerate(csl_items):
         if it.doi:
             by_doi[it.doi.lower()] = it
-        by_title.setdefault(it.title_norm, []).append(it)
+        prev = by_title.get(it.title_norm)
+        by_title[it.title_norm] = it if prev is None else _prefer(prev, it)
+        if it.year:
+            by_year.setdefault(it.year, []).append(i)
         if it.authors and it.year:
             first_last = it.authors[0].split()[-1].lower()
             key = f"{first_last}|{it.year}"
-            by_auth_year.setdefault(key, []).append(it)
-    return by_doi, by_title, by_auth_year
+            prev = by_auth_year.get(key)
+            by_auth_year[key] = it if prev is None else _prefer(prev, it)
+    return by_doi, by_title, by_auth_year, by_year
+
+
+def _manual_set(md: dict, prov: dict, k: str, v: Any, note: str, changed: List[str]) -> None:
+    old = md.get(k)
+    if v is not None and old != v:
+        md[k] = v
+        log_manual_patch(prov, f'metadata.{k}', old, v, note=note)
+        changed.append(k)
+
+
+def apply_overrides(
+    obj: dict,
+    fname: str,
+    title: str,
+    tnorm: str,
+    ov_by_fn: Dict[str, Any],
+    ov_by_title: Dict[str, Any],
+    by_doi: Dict[str, CSLItem],
+    by_id: Dict[str, CSLItem],
+) -> Tuple[Optional[CSLItem], str, Optional[float], Optional[Dict[str, Any]]]:
+    """One pass over the override maps for a file: resolves a forced match
+    (by DOI or Zotero key), applies any by-filename manual field patches,
+    and returns the by-title field patches for the caller to apply if the
+    file ends up unmatched. Returns (match, method, conf, ov_title_fields)."""
+    match: Optional[CSLItem] = None
+    method = ""
+    conf: Optional[float] = None
+
+    # filename overrides may be a string or an object {doi:..., key:...}
+    ov_entry = ov_by_fn.get(fname)
+    if isinstance(ov_entry, dict):
+        kdoi = ov_entry.get('doi')
+        kid = ov_entry.get('key')
+        if isinstance(kdoi, str) and kdoi.lower() in by_doi:
+            match = by_doi[kdoi.lower()]
+            method = 'override:doi'
+            conf = 1.0
+        elif isinstance(kid, str) and kid in by_id:
+            match = by_id[kid]
+            method = 'override:id'
+            conf = 1.0
+    elif isinstance(ov_entry, str):
+        k = ov_entry
+        if k.lower().startswith('10.') and k.lower() in by_doi:
+            match = by_doi[k.lower()]
+            method = 'override:doi'
+            conf = 1.0
+        elif k in by_id:
+            match = by_id[k]
+            method = 'override:id'
+            conf = 1.0
+
+    # title overrides may contain literal field values; cache for later
+    ov_title_fields = None
+    if tnorm:
+        ov_title_fields = ov_by_title.get(tnorm)
+        if ov_title_fields is None:
+            # try raw lower as fallback
+            ov_title_fields = ov_by_title.get((title or '').strip().lower())
+
+    # Apply any by-filename manual field patches (e.g., year/pages)
+    # regardless of match
+    if isinstance(ov_entry, dict):
+        md_local = obj.setdefault('metadata', {})
+        prov_local = obj.setdefault('provenance', {})
+        changed_fn: List[str] = []
+        for k in ('year', 'journal', 'volume', 'issue', 'pages', 'authors', 'doi'):
+            if k in ov_entry:
+                val = ov_entry[k]
+                if k == 'year' and isinstance(val, (int, str)):
+                    try:
+                        yi = int(str(val)[:4])
+                    except Exception:
+                        yi = None
+                    if yi is not None:
+                        _manual_set(md_local, prov_local, 'year', yi, 'override:by_filename', changed_fn)
+                        _manual_set(md_local, prov_local, 'year_norm', str(yi), 'override:by_filename', changed_fn)
+                elif k == 'authors' and isinstance(val, list):
+                    _manual_set(md_local, prov_local, 'authors', val, 'override:by_filename', changed_fn)
+                elif k == 'doi' and isinstance(val, str):
+                    _manual_set(md_local, prov_local, 'doi', val, 'override:by_filename', changed_fn)
+                else:
+                    _manual_set(md_local, prov_local, k, val, 'override:by_filename', changed_fn)
+
+    return match, method, conf, ov_title_fields
+
+
+def apply_title_overrides(obj: dict, ov_title_fields: Dict[str, Any]) -> List[str]:
+    """Apply literal field values from a by-title override to an unmatched
+    file; returns the list of changed field names."""
+    prov = obj.setdefault('provenance', {})
+    md = obj.setdefault('metadata', {})
+    changed: List[str] = []
+    if 'journal' in ov_title_fields:
+        _manual_set(md, prov, 'journal', ov_title_fields['journal'], 'override:by_title', changed)
+    if 'year' in ov_title_fields:
+        y = ov_title_fields['year']
+        _manual_set(md, prov, 'year', int(y), 'override:by_title', changed)
+        _manual_set(md, prov, 'year_norm', str(y), 'override:by_title', changed)
+    if 'volume' in ov_title_fields:
+        _manual_set(md, prov, 'volume', str(ov_title_fields['volume']), 'override:by_title', changed)
+    if 'pages' in ov_title_fields:
+        _manual_set(md, prov, 'pages', ov_title_fields['pages'], 'override:by_title', changed)
+    if 'authors' in ov_title_fields and isinstance(ov_title_fields['authors'], list):
+        _manual_set(md, prov, 'authors', ov_title_fields['authors'], 'override:by_title', changed)
+    return changed
+
+
+# Worker-side read-only state for the process pool: the indices are pickled
+# once per worker via the initializer instead of once per submitted file.
+_CTX: Dict[str, Any] = {}
+
+
+def _init_worker(ctx: Dict[str, Any]) -> None:
+    _CTX.update(ctx)
+
+
+def _merge_one_file(p_str: str) -> Tuple[Dict[str, Any], Dict[str, int]]:
+    """Parse, match, merge and (unless dry-run) write a single extracted
+    JSON. Returns the report row plus summary-counter increments; output
+    paths are disjoint, so workers write their own results."""
+    p = Path(p_str)
+    csl_items: List[CSLItem] = _CTX["csl_items"]
+    fuzzy_idx: FuzzyIndex = _CTX["fuzzy_idx"]
+    by_doi: Dict[str, CSLItem] = _CTX["by_doi"]
+    by_title: Dict[str, CSLItem] = _CTX["by_title"]
+    by_auth_year: Dict[str, CSLItem] = _CTX["by_auth_year"]
+    by_year: Dict[int, List[int]] = _CTX["by_year"]
+    by_id: Dict[str, CSLItem] = _CTX["by_id"]
+    csvmap: Dict[str, CSVInfo] = _CTX["csvmap"]
+    csv_by_titlenorm: Dict[str, CSVInfo] = _CTX["csv_by_titlenorm"]
+    overrides: Dict[str, Any] = _CTX["overrides"]
+    ov_by_fn: Dict[str, Any] = _CTX["ov_by_fn"]
+    ov_by_title: Dict[str, Any] = _CTX["ov_by_title"]
+    args = _CTX["args"]
+    outdir = Path(args.outdir)
+
+    counters: Dict[str, int] = {}
+
+    def inc(key: str) -> None:
+        counters[key] = counters.get(key, 0) + 1
+
+    try:
+        obj = _load_json(p)
+    except Exception as e:
+        inc("errors")
+        return {"file": str(p), "status": "error", "error": str(e)}, counters
+    md = obj.get("metadata") or {}
+    title = md.get("title") or ""
+    tnorm = norm_text(title)
+    doi_json = (md.get("doi") or "").lower().strip() or None
+    year_json = parse_year_int(md.get("year"))
+    first_last = first_author_last_from_json(md.get("authors"))
+
+    match: Optional[CSLItem] = None
+    method = ""
+    conf: Optional[float] = None
+
+    # 0) Overrides by filename or title_norm: forced match plus any
+    # by-filename field patches, in one pass over the override maps
+    ov_title_fields = None
+    if overrides:
+        match, method, conf, ov_title_fields = apply_overrides(
+            obj, p.name, title, tnorm, ov_by_fn, ov_by_title, by_doi, by_id)
+
+    # 1) DOI (if not overridden)
+    if doi_json and doi_json in by_doi:
+        match = by_doi[doi_json]
+        method = "doi"
+        conf = 1.0
+        inc("matched_doi")
+    # 2) exact title
+    elif tnorm and tnorm in by_title:
+        match = by_title[tnorm]
+        method = "title_exact"
+        conf = 1.0
+        inc("matched_title_exact")
+    else:
+        # 3) fuzzy title
+        best: Tuple[Optional[CSLItem], float] = (None, 0.0)
+        if tnorm:
+            # A known publication year narrows the fuzzy candidates to a
+            # +/-1-year window; off-window or missing years fall back to
+            # the whole corpus.
+            cand_idxs = None
+            if year_json is not None:
+                window = (by_year.get(year_json - 1, [])
+                          + by_year.get(year_json, [])
+                          + by_year.get(year_json + 1, []))
+                if window:
+                    cand_idxs = window
+            best = best_fuzzy_match(title, csl_items, fuzzy_idx, cand_idxs)
+            if cand_idxs is not None and (best[0] is None or best[1] < args.min_fuzzy):
+                # The window may exclude the true match (bad year metadata);
+                # rescan the full corpus so recall is unchanged.
+                best = best_fuzzy_match(title, csl_items, fuzzy_idx)
+            if best[0] is not None and best[1] >= args.min_fuzzy:
+                match = best[0]
+                method = "title_fuzzy"
+                conf = round(best[1], 4)
+                inc("matched_title_fuzzy")
+
+    # 4) author+year backup (if still no match)
+    if match is None and first_last and year_json is not None:
+        key = f"{first_last}|{year_json}"
+        cand = by_auth_year.get(key)
+        if cand is not None:
+            match = cand
+            method = "author_year"
+            conf = 0.9
+            inc("matched_author_year")
+
+    if match is None:
+        inc("unmatched")
+        # Apply manual field overrides by title if provided
+        if overrides and ov_title_fields:
+            changed_fields = apply_title_overrides(obj, ov_title_fields)
+            status = 'manual_override' if changed_fields else 'unmatched'
+            row = {
+                'file': str(p),
+                'status': status,
+                'match_method': 'override:by_title' if changed_fields else '',
+                'match_confidence': '',
+                'changed_fields': ';'.join(changed_fields),
+                'doi_json': doi_json or '',
+                'doi_zotero': '',
+                'doi_conflict': '',
+                'pdf_basename': '',
+                'title_norm': tnorm,
+            }
+            # write out if not dry-run
+            if changed_fields and not args.dry_run:
+                _dump_json(obj, outdir / p.name)
+            return row, counters
+        else:
+            row = {
+                "file": str(p),
+                "status": "unmatched",
+                "title_norm": tnorm,
+            }
+            if not args.strict and not args.dry_run:
+                # pass-through: nothing changed, so copy raw bytes instead
+                # of re-serializing the parsed object
+                shutil.copyfile(p, outdir / p.name)
+            return row, counters
+
+    # check DOI conflict
+    doi_conflict = False
+    if doi_json and match.doi and doi_json != match.doi:
+        doi_conflict = True
+        inc("doi_conflicts")
+
+    # Merge and write
+    # CSV: prefer by key if match.id; else by precomputed normalized title
+    csvinfo = None
+    if match.id:
+        csvinfo = csvmap.get(match.id)
+    if csvinfo is None and match.title_norm:
+        csvinfo = csv_by_titlenorm.get(match.title_norm)
+
+    merged_obj, changed = merge_fields(obj, match, csvinfo, match_method=method,
+                                       confidence=conf, now_iso=_CTX["now_iso"])
+    status = "changed" if changed else "unchanged"
+
+    if not args.dry_run and (not args.strict or (args.strict and not doi_conflict)):
+        _dump_json(merged_obj, outdir / p.name)
+
+    row = {
+        "file": str(p),
+        "status": status,
+        "match_method": method,
+        "match_confidence": conf if conf is not None else "",
+        "changed_fields": ";".join(changed),
+        "doi_json": doi_json or "",
+        "doi_zotero": match.doi or "",
+        "doi_conflict": "yes" if doi_conflict else "",
+        "pdf_basename": (csvinfo.pdf_basenames[0] if csvinfo and csvinfo.pdf_basenames else ""),
+    }
+    return row, counters
 
 
 def main():
@@ -296,14 +806,15 @@ def main():
         outdir.mkdir(parents=True, exist_ok=True)
 
     csl_items = load_csl_json(Path(args.zotero_json))
-    csvmap = load_zotero_csv(Path(args.zotero_csv))
-    by_doi, by_title, by_auth_year = build_indices(csl_items)
+    csvmap, csv_by_titlenorm = load_zotero_csv(Path(args.zotero_csv))
+    by_doi, by_title, by_auth_year, by_year = build_indices(csl_items)
     by_id = {it.id: it for it in csl_items if it.id}
+    fuzzy_idx = build_fuzzy_index(csl_items, args.min_fuzzy)
 
     overrides = {}
     if args.overrides:
         try:
-            overrides = json.loads(Path(args.overrides).read_text(encoding="utf-8"))
+            overrides = _load_json(Path(args.overrides))
         except Exception as e:
             print(f"Warning: failed to load overrides: {e}")
 
@@ -320,252 +831,73 @@ def main():
         "notes": [],
     }
 
-    files = sorted(p for p in inp.glob("*.json") if p.name != "processing_report.json")
-    for p in files:
-        summary["total"] += 1
-        try:
-            obj = json.loads(p.read_text(encoding="utf-8"))
-        except Exception as e:
-            summary["errors"] += 1
-            report_rows.append({
-                "file": str(p),
-                "status": "error",
-                "error": str(e),
-            })
-            continue
-        md = obj.get("metadata") or {}
-        title = md.get("title") or ""
-        tnorm = norm_text(title)
-        doi_json = (md.get("doi") or "").lower().strip() or None
-        year_json = parse_year_int(md.get("year"))
-        first_last = first_author_last_from_json(md.get("authors"))
-
-        match: Optional[CSLItem] = None
-        method = ""
-        conf: Optional[float] = None
-
-        # 0) Overrides by filename or title_norm
-        ov_match = None
-        if overrides:
-            ov_by_fn = (overrides.get('by_filename') or {})
-            ov_by_title = (overrides.get('by_title') or {})
-            # filename overrides may be a string or an object {doi:..., key:...}
-            ov_entry = ov_by_fn.get(p.name)
-            if isinstance(ov_entry, dict):
-                kdoi = ov_entry.get('doi')
-                kid = ov_entry.get('key')
-                if isinstance(kdoi, str) and kdoi.lower() in by_doi:
-                    ov_match = by_doi[kdoi.lower()]
-                    method = 'override:doi'
-                    conf = 1.0
-                elif isinstance(kid, str) and kid in by_id:
-                    ov_match = by_id[kid]
-                    method = 'override:id'
-                    conf = 1.0
-            elif isinstance(ov_entry, str):
-                k = ov_entry
-                if k.lower().startswith('10.') and k.lower() in by_doi:
-                    ov_match = by_doi[k.lower()]
-                    method = 'override:doi'
-                    conf = 1.0
-                elif k in by_id:
-                    ov_match = by_id[k]
-                    method = 'override:id'
-                    conf = 1.0
-            # title overrides may contain literal field values; cache for later
-            ov_title_fields = None
-            if tnorm:
-                ov_title_fields = ov_by_title.get(tnorm)
-                if ov_title_fields is None:
-                    # try raw lower as fallback
-                    ov_title_fields = ov_by_title.get((title or '').strip().lower())
-            if ov_match is not None:
-                match = ov_match
-            # if no match yet and override provides fields, we will apply them later
-        if ov_match is not None:
-            match = ov_match
-
-        # Apply any by-filename manual field overrides (e.g., year/pages) regardless of match
-        changed_from_fn = []
-        if overrides and isinstance(ov_entry, dict):
-            md_local = obj.setdefault('metadata', {})
-            prov_local = obj.setdefault('provenance', {})
-            def manual_set_fn(k, v):
-                old = md_local.get(k)
-                if v is not None and old != v:
-                    md_local[k] = v
-                    log_manual_patch(prov_local, f'metadata.{k}', old, v, note='override:by_filename')
-                    changed_from_fn.append(k)
-            for k in ('year','journal','volume','issue','pages','authors','doi'):
-                if k in ov_entry:
-                    val = ov_entry[k]
-                    if k == 'year' and isinstance(val, (int,str)):
-                        try:
-                            yi = int(str(val)[:4])
-                        except Exception:
-                            yi = None
-                        if yi is not None:
-                            manual_set_fn('year', yi)
-                            manual_set_fn('year_norm', str(yi))
-                    elif k == 'authors' and isinstance(val, list):
-                        manual_set_fn('authors', val)
-                    elif k == 'doi' and isinstance(val, str):
-                        manual_set_fn('doi', val)
-                    else:
-                        manual_set_fn(k, val)
-        # 1) DOI (if not overridden)
-        if doi_json and doi_json in by_doi:
-            match = by_doi[doi_json]
-            method = "doi"
-            conf = 1.0
-            summary["matched_doi"] += 1
-        # 2) exact title
-        elif tnorm and tnorm in by_title:
-            lst = by_title[tnorm]
-            match = lst[0]
-            method = "title_exact"
-            conf = 1.0
-            summary["matched_title_exact"] += 1
-        else:
-            # 3) fuzzy title
-            best: Tuple[Optional[CSLItem], float] = (None, 0.0)
-            if tnorm:
-                a = token_set(title)
-                for it in csl_items:
-                    b = token_set(it.title)
-                    s = jaccard(a, b)
-                    if s > best[1]:
-                        best = (it, s)
-                if best[0] is not None and best[1] >= args.min_fuzzy:
-                    match = best[0]
-                    method = "title_fuzzy"
-                    conf = round(best[1], 4)
-                    summary["matched_title_fuzzy"] += 1
-
-        # 4) author+year backup (if still no match)
-        if match is None and first_last and year_json is not None:
-            key = f"{first_last}|{year_json}"
-            lst = by_auth_year.get(key)
-            if lst:
-                match = lst[0]
-                method = "author_year"
-                conf = 0.9
-                summary["matched_author_year"] += 1
-
-        if match is None:
-            summary["unmatched"] += 1
-            # Apply manual field overrides by title if provided
-            if overrides and 'ov_title_fields' in locals() and ov_title_fields:
-                prov = obj.setdefault('provenance', {})
-                md = obj.setdefault('metadata', {})
-                changed_fields = []
-                def manual_set(k, v):
-                    nonlocal changed_fields
-                    old = md.get(k)
-                    if old != v and v is not None:
-                        md[k] = v
-                        log_manual_patch(prov, f'metadata.{k}', old, v, note='override:by_title')
-                        changed_fields.append(k)
-                # known fields
-                if 'journal' in ov_title_fields:
-                    manual_set('journal', ov_title_fields['journal'])
-                if 'year' in ov_title_fields:
-                    y = ov_title_fields['year']
-                    manual_set('year', int(y))
-                    manual_set('year_norm', str(y))
-                if 'volume' in ov_title_fields:
-                    manual_set('volume', str(ov_title_fields['volume']))
-                if 'pages' in ov_title_fields:
-                    manual_set('pages', ov_title_fields['pages'])
-                if 'authors' in ov_title_fields and isinstance(ov_title_fields['authors'], list):
-                    manual_set('authors', ov_title_fields['authors'])
-
-                status = 'manual_override' if changed_fields else 'unmatched'
-                report_rows.append({
-                    'file': str(p),
-                    'status': status,
-                    'match_method': 'override:by_title' if changed_fields else '',
-                    'match_confidence': '',
-                    'changed_fields': ';'.join(changed_fields),
-                    'doi_json': doi_json or '',
-                    'doi_zotero': '',
-                    'doi_conflict': '',
-                    'pdf_basename': '',
-                    'title_norm': tnorm,
-                })
-                # write out if not dry-run
-                if changed_fields and not args.dry_run:
-                    (outdir / p.name).write_text(json.dumps(obj, ensure_ascii=False, indent=2), encoding='utf-8')
-                continue
-            else:
-                report_rows.append({
-                    "file": str(p),
-                    "status": "unmatched",
-                    "title_norm": tnorm,
-                })
-                if not args.strict and not args.dry_run:
-                    # pass-through write
-                    (outdir / p.name).write_text(json.dumps(obj, ensure_ascii=False, indent=2), encoding="utf-8")
-                continue
-
-        # check DOI conflict
-        doi_conflict = False
-        if doi_json and match.doi and doi_json != match.doi:
-            doi_conflict = True
-            summary["doi_conflicts"] += 1
-
-        # Merge and write
-        csvinfo = None
-        # CSV: prefer by key if match.id; else by title
-        if match.id and match.id in csvmap:
-            csvinfo = csvmap[match.id]
-        else:
-            # attempt by normalized title match
-            for info in csvmap.values():
-                if info.title_norm and info.title_norm == match.title_norm:
-                    csvinfo = info
-                    break
-
-        merged_obj, changed = merge_fields(obj, match, csvinfo, match_method=method, confidence=conf)
-        status = "changed" if changed else "unchanged"
-
-        if not args.dry_run and (not args.strict or (args.strict and not doi_conflict)):
-            (outdir / p.name).write_text(json.dumps(merged_obj, ensure_ascii=False, indent=2), encoding="utf-8")
-
-        report_rows.append({
-            "file": str(p),
-            "status": status,
-            "match_method": method,
-            "match_confidence": conf if conf is not None else "",
-            "changed_fields": ";".join(changed),
-            "doi_json": doi_json or "",
-            "doi_zotero": match.doi or "",
-            "doi_conflict": "yes" if doi_conflict else "",
-            "pdf_basename": (csvinfo.pdf_basenames[0] if csvinfo and csvinfo.pdf_basenames else ""),
-        })
-
-    # Write reports
+    # os.scandir lists names without a stat per entry, unlike pathlib glob
+    files = sorted(
+        inp / e.name
+        for e in os.scandir(inp)
+        if e.is_file(follow_symlinks=False)
+        and e.name.endswith(".json")
+        and e.name != "processing_report.json"
+    )
+    summary["total"] = len(files)
+
+    # Each file is parsed, matched, merged and written independently; the
+    # indices are read-only after build, so fan the loop out over a process
+    # pool (initializer pickles the shared state once per worker) and fold
+    # report rows and counters back in submission order.
+    ctx = {
+        "csl_items": csl_items,
+        "fuzzy_idx": fuzzy_idx,
+        "by_doi": by_doi,
+        "by_title": by_title,
+        "by_auth_year": by_auth_year,
+        "by_year": by_year,
+        "by_id": by_id,
+        "csvmap": csvmap,
+        "csv_by_titlenorm": csv_by_titlenorm,
+        "overrides": overrides,
+        # Hoisted out of the per-file body: the override sub-maps and the
+        # export timestamp are loop-invariant.
+        "ov_by_fn": overrides.get("by_filename") or {},
+        "ov_by_title": overrides.get("by_title") or {},
+        "now_iso": datetime.utcnow().isoformat() + "Z",
+        "args": args,
+    }
+    file_names = [str(p) for p in files]
+    if len(files) > 1 and (os.cpu_count() or 1) > 1:
+        with ProcessPoolExecutor(
+            max_workers=os.cpu_count(), initializer=_init_worker, initargs=(ctx,)
+        ) as ex:
+            results = list(ex.map(_merge_one_file, file_names))
+    else:
+        _init_worker(ctx)
+        results = [_merge_one_file(name) for name in file_names]
+
+    for row, counters in results:
+        report_rows.append(row)
+        for k, v in counters.items():
+            summary[k] += v
+
+    # Write reports: plain csv.writer with one writerows call, instead of a
+    # DictWriter doing per-row fieldname lookups.
     rep_csv = reportdir / "zotero_merge_report.csv"
-    with rep_csv.open("w", newline="", encoding="utf-8") as f:
-        fieldnames = [
-            "file",
-            "status",
-            "match_method",
-            "match_confidence",
-            "changed_fields",
-            "doi_json",
-            "doi_zotero",
-            "doi_conflict",
-            "pdf_basename",
-            "title_norm",
-            "error",
-        ]
-        w = csv.DictWriter(f, fieldnames=fieldnames)
-        w.writeheader()
-        for row in report_rows:
-            if "error" not in row:
-                row["error"] = ""
-            w.writerow(row)
+    fieldnames = [
+        "file",
+        "status",
+        "match_method",
+        "match_confidence",
+        "changed_fields",
+        "doi_json",
+        "doi_zotero",
+        "doi_conflict",
+        "pdf_basename",
+        "title_norm",
+        "error",
+    ]
+    with open(rep_csv, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        w = csv.writer(f)
+        w.writerow(fieldnames)
+        w.writerows([row.get(fn, "") for fn in fieldnames] for row in report_rows)
 
     rep_json = reportdir / "zotero_merge_summary.json"
     rep_json.write_text(json.dumps(summary, indent=2), encoding="utf-8")
@@ -2,9 +2,73 @@
 import argparse
 import csv
 import json
+import mmap
+import os
 import re
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Distinguishes "file would not parse" from "parsed but no metadata".
+_JSON_ERROR = object()
+
+
+def _parse_one(p: Path):
+    """Read and parse one JSON; returns (path, obj) or (path, None) on error.
+
+    With orjson, non-empty files are mmapped and parsed through a
+    memoryview: the parser reads the page cache directly instead of
+    copying the whole file into a bytes object first.
+    """
+    try:
+        if orjson is not None:
+            with p.open("rb") as f:
+                if os.fstat(f.fileno()).st_size > 0:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        return p, orjson.loads(memoryview(mm))
+                return p, orjson.loads(f.read())
+        return p, json.loads(p.read_text(encoding="utf-8"))
+    except Exception:
+        return p, None
+
+
+def _read_metadata(p: Path):
+    """Fetch just the top-level "metadata" object from one JSON file.
+
+    The audit only inspects metadata, but the files carry full document
+    structure (sections, tables, raw text) that a whole-file parse decodes
+    and throws away. With ijson installed, stream top-level key/value
+    pairs and stop at "metadata"; the rest of the document is never
+    materialized. Returns _JSON_ERROR when the file cannot be parsed.
+    """
+    if ijson is not None:
+        try:
+            with p.open("rb") as f:
+                for k, v in ijson.kvitems(f, ""):
+                    if k == "metadata":
+                        return v
+            return None
+        except Exception:
+            return _JSON_ERROR
+    _, obj = _parse_one(p)
+    if obj is None:
+        return _JSON_ERROR
+    return obj.get("metadata") if isinstance(obj, dict) else None
+
+
+# Issue rows are (file, issues, error) tuples, matching the CSV columns,
+# so the report writes with one csv.writer.writerows call at the end.
+
 # Strict tokens per spec
 ACK_TOKENS = (
     "author contributions",
@@ -19,209 +83,261 @@ ACK_TOKENS = (
     "supplementary",
 )
 
+# Single alternation over all tokens: one C-level scan per author string
+# instead of ten Python-level substring checks.
+_ACK_RE = re.compile("|".join(map(re.escape, ACK_TOKENS)))
+
 
 def detect_ack_like(tokens):
     if not tokens:
         return False, 0.0
     hits = 0
     for t in tokens:
-        if isinstance(t, str):
-            low = t.lower()
-            if any(tok in low for tok in ACK_TOKENS):
-                hits += 1
+        if isinstance(t, str) and _ACK_RE.search(t.lower()):
+            hits += 1
     ratio = hits / max(1, len(tokens))
     return hits > 0, ratio
 
 
 def is_blank(x):
-    if x is None:
-        return True
+    # Most metadata fields are strings; test that case first.
     if isinstance(x, str):
         return not x.strip()
+    if x is None:
+        return True
     if isinstance(x, (list, dict)):
         return len(x) == 0
     return False
 
 
-def audit_dir(in_dir: Path, out_dir: Path, limit: int | None = None):
-    files = sorted(p for p in in_dir.rglob("*.json"))
-    if limit:
-        files = files[:limit]
-    year_re = re.compile(r"^\d{4}(?:-(?:0[1-9]|1[0-2]))?(?:-(?:0[1-9]|[12]\d|3[01]))?$")
-
-    summary = {
-        "total_files": 0,
-        "json_errors": 0,
-        "missing_metadata": 0,
-        "missing_title": 0,
-        "missing_year": 0,
-        "invalid_year_format": 0,
-        "missing_authors": 0,
-        "empty_authors": 0,
-        "authors_ack_like": 0,
-        "missing_doi": 0,
-        "missing_journal": 0,
-        "missing_abstract": 0,
-        "has_references_text": 0,
-        "has_references_struct": 0,
-        "empty_references_struct": 0,
-    }
+_YEAR_FMT_RE = re.compile(r"^\d{4}(?:-(?:0[1-9]|1[0-2]))?(?:-(?:0[1-9]|[12]\d|3[01]))?$")
 
-    details_rows = []
+_SUMMARY_KEYS = (
+    "total_files",
+    "json_errors",
+    "missing_metadata",
+    "missing_title",
+    "missing_year",
+    "invalid_year_format",
+    "missing_authors",
+    "empty_authors",
+    "authors_ack_like",
+    "missing_doi",
+    "missing_journal",
+    "missing_abstract",
+    "has_references_text",
+    "has_references_struct",
+    "empty_references_struct",
+    "files_with_issues",
+)
 
-    for p in files:
-        summary["total_files"] += 1
-        try:
-            obj = json.loads(p.read_text(encoding="utf-8"))
-        except Exception:
-            summary["json_errors"] += 1
-            details_rows.append({
-                "file": str(p),
-                "error": "json_error",
-            })
-            continue
-
-        md = obj.get("metadata")
-        if not isinstance(md, dict):
-            summary["missing_metadata"] += 1
-            details_rows.append({
-                "file": str(p),
-                "error": "missing_metadata",
-            })
-            continue
-
-        # Title
-        title = md.get("title")
-        if is_blank(title):
-            summary["missing_title"] += 1
-
-        # Year
-        year = md.get("year")
-        if is_blank(year):
-            summary["missing_year"] += 1
-        else:
-            ys = str(year).strip()
-            if not year_re.match(ys):
-                summary["invalid_year_format"] += 1
-
-        # Authors
-        authors = md.get("authors")
-        if authors is None:
-            summary["missing_authors"] += 1
-        else:
-            # normalize to list of strings
-            norm = []
-            group_only = True
-            if isinstance(authors, str):
-                norm = [a.strip() for a in authors.split(";") if a.strip()]
-                group_only = False
-            elif isinstance(authors, list):
-                for a in authors:
-                    if isinstance(a, str):
-                        norm.append(a.strip())
-                        group_only = False
-                    elif isinstance(a, dict):
-                        # new schema: person object or group
-                        if a.get("group"):
-                            display = a.get("display") or ""
-                            if display:
-                                norm.append(display)
-                        else:
-                            given = (a.get("given") or "").strip()
-                            family = (a.get("family") or "").strip()
-                            if given or family:
-                                norm.append((given + " " + family).strip())
-                                group_only = False
-            if not norm:
-                summary["empty_authors"] += 1
-            else:
-                ack_like, _ = detect_ack_like(norm)
-                if ack_like:
-                    summary["authors_ack_like"] += 1
-
-        # DOI / Journal / Abstract
-        doi = md.get("doi") or md.get("DOI")
-        if is_blank(doi):
-            summary["missing_doi"] += 1
-
-        journal = md.get("journal") or md.get("journal_name") or md.get("venue")
-        if is_blank(journal):
-            summary["missing_journal"] += 1
-
-        abstract = md.get("abstract") or md.get("abstract_text")
-        if is_blank(abstract):
-            summary["missing_abstract"] += 1
-
-        # References
-        if "references_text" in md:
-            summary["has_references_text"] += 1
-        if "references_struct" in md:
-            summary["has_references_struct"] += 1
-            rs = md.get("references_struct")
-            if isinstance(rs, list) and len(rs) == 0:
-                summary["empty_references_struct"] += 1
-
-        # Row of issue codes for this file
-        issues = []
-        if is_blank(title): issues.append("META_TITLE_MISSING")
-        if is_blank(year):
-            issues.append("META_YEAR_MISSING")
-        else:
-            ys = str(year).strip()
-            if not year_re.match(ys) and not isinstance(year, int):
-                issues.append("YEAR_FORMAT_INVALID")
-        if is_blank(doi): issues.append("META_DOI_MISSING")
-        if is_blank(journal): issues.append("META_JOURNAL_MISSING")
-        if is_blank(abstract): issues.append("ABSTRACT_MISSING")
-        if authors is None:
-            issues.append("AUTHORS_MISSING")
-        elif is_blank(authors):
-            issues.append("AUTHORS_EMPTY")
-        else:
-            # Build normalized list to check ack-like and group-only
-            norm = []
-            groups = 0
-            total = 0
-            if isinstance(authors, list):
-                for a in authors:
-                    total += 1
-                    if isinstance(a, dict) and a.get("group"):
-                        groups += 1
-                        disp = a.get("display") or ""
-                        if disp:
-                            norm.append(disp)
-                    elif isinstance(a, dict):
+# Counters travel between workers as fixed-index int arrays rather than
+# dicts: increments and the per-file merge are plain indexed stores, with
+# no hashing, and the array pickles compactly.
+_IDX = {k: i for i, k in enumerate(_SUMMARY_KEYS)}
+
+
+def _audit_one(p_str: str):
+    """Parse and check a single file; pure so it can run in a worker
+    process. Returns (summary_delta, details_row)."""
+    p = Path(p_str)
+    delta = array("q", bytes(8 * len(_SUMMARY_KEYS)))
+    delta[_IDX["total_files"]] = 1
+
+    def inc(key):
+        delta[_IDX[key]] += 1
+
+    md = _read_metadata(p)
+    if md is _JSON_ERROR:
+        inc("json_errors")
+        return delta, (str(p), "", "json_error")
+
+    if not isinstance(md, dict):
+        inc("missing_metadata")
+        return delta, (str(p), "", "missing_metadata")
+
+    # Each field's blankness is needed twice (summary counter + issue
+    # row), so compute it once up front instead of re-dispatching.
+    # Title
+    title = md.get("title")
+    title_blank = is_blank(title)
+    if title_blank:
+        inc("missing_title")
+
+    # Year
+    year = md.get("year")
+    year_blank = is_blank(year)
+    year_fmt_ok = True
+    if year_blank:
+        inc("missing_year")
+    else:
+        year_fmt_ok = bool(_YEAR_FMT_RE.match(str(year).strip()))
+        if not year_fmt_ok:
+            inc("invalid_year_format")
+
+    # Authors
+    authors = md.get("authors")
+    if authors is None:
+        inc("missing_authors")
+    else:
+        # normalize to list of strings
+        norm = []
+        group_only = True
+        if isinstance(authors, str):
+            norm = [a.strip() for a in authors.split(";") if a.strip()]
+            group_only = False
+        elif isinstance(authors, list):
+            for a in authors:
+                if isinstance(a, str):
+                    norm.append(a.strip())
+                    group_only = False
+                elif isinstance(a, dict):
+                    # new schema: person object or group
+                    if a.get("group"):
+                        display = a.get("display") or ""
+                        if display:
+                            norm.append(display)
+                    else:
                         given = (a.get("given") or "").strip()
                         family = (a.get("family") or "").strip()
                         if given or family:
                             norm.append((given + " " + family).strip())
-                    elif isinstance(a, str):
-                        norm.append(a.strip())
-            else:
-                norm = [str(authors)]
-            ack_like, _ = detect_ack_like(norm)
+                            group_only = False
+        if not norm:
+            inc("empty_authors")
+        else:
+            ack_like, _ratio = detect_ack_like(norm)
             if ack_like:
-                issues.append("AUTHORS_ACK_LIKE")
-            if total > 0 and groups == total:
-                issues.append("AUTHORS_GROUP_ONLY")
-        details_rows.append({
-            "file": str(p),
-            "issues": ",".join(issues) if issues else "",
-        })
+                inc("authors_ack_like")
+
+    # DOI / Journal / Abstract
+    doi = md.get("doi") or md.get("DOI")
+    doi_blank = is_blank(doi)
+    if doi_blank:
+        inc("missing_doi")
+
+    journal = md.get("journal") or md.get("journal_name") or md.get("venue")
+    journal_blank = is_blank(journal)
+    if journal_blank:
+        inc("missing_journal")
+
+    abstract = md.get("abstract") or md.get("abstract_text")
+    abstract_blank = is_blank(abstract)
+    if abstract_blank:
+        inc("missing_abstract")
+
+    # References
+    if "references_text" in md:
+        inc("has_references_text")
+    if "references_struct" in md:
+        inc("has_references_struct")
+        rs = md.get("references_struct")
+        if isinstance(rs, list) and len(rs) == 0:
+            inc("empty_references_struct")
+
+    # Row of issue codes for this file
+    issues = []
+    if title_blank: issues.append("META_TITLE_MISSING")
+    if year_blank:
+        issues.append("META_YEAR_MISSING")
+    elif not year_fmt_ok and not isinstance(year, int):
+        issues.append("YEAR_FORMAT_INVALID")
+    if doi_blank: issues.append("META_DOI_MISSING")
+    if journal_blank: issues.append("META_JOURNAL_MISSING")
+    if abstract_blank: issues.append("ABSTRACT_MISSING")
+    if authors is None:
+        issues.append("AUTHORS_MISSING")
+    elif is_blank(authors):
+        issues.append("AUTHORS_EMPTY")
+    else:
+        # Build normalized list to check ack-like and group-only
+        norm = []
+        groups = 0
+        total = 0
+        if isinstance(authors, list):
+            for a in authors:
+                total += 1
+                if isinstance(a, dict) and a.get("group"):
+                    groups += 1
+                    disp = a.get("display") or ""
+                    if disp:
+                        norm.append(disp)
+                elif isinstance(a, dict):
+                    given = (a.get("given") or "").strip()
+                    family = (a.get("family") or "").strip()
+                    if given or family:
+                        norm.append((given + " " + family).strip())
+                elif isinstance(a, str):
+                    norm.append(a.strip())
+        else:
+            norm = [str(authors)]
+        ack_like, _ratio = detect_ack_like(norm)
+        if ack_like:
+            issues.append("AUTHORS_ACK_LIKE")
+        if total > 0 and groups == total:
+            issues.append("AUTHORS_GROUP_ONLY")
+    return delta, (str(p), ",".join(issues), "")
+
+
+def _iter_json(root):
+    """Yield paths of all .json files under root via an explicit scandir
+    stack - no per-entry Path construction or stat, unlike rglob."""
+    stack = [os.fspath(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for e in it:
+                if e.is_dir(follow_symlinks=False):
+                    stack.append(e.path)
+                elif e.name.endswith(".json"):
+                    yield e.path
+
+
+def audit_dir(in_dir: Path, out_dir: Path, limit: int | None = None):
+    # Sorting keeps report order (and the meaning of --limit) stable
+    # across filesystems; the walk itself stays scandir-cheap.
+    files = sorted(_iter_json(in_dir))
+    if limit:
+        files = files[:limit]
+
+    counts = array("q", bytes(8 * len(_SUMMARY_KEYS)))
+    issues_idx = _IDX["files_with_issues"]
+    details_rows = []
+
+    # Each file audits independently; fan out over processes and fold the
+    # per-file deltas back in file order (map preserves it), so reports are
+    # unchanged. chunksize amortizes IPC on large corpora.
+    if files:
+        chunksize = max(1, len(files) // ((os.cpu_count() or 1) * 4))
+        with ProcessPoolExecutor() as ex:
+            for delta, row in ex.map(_audit_one, files, chunksize=chunksize):
+                for i, v in enumerate(delta):
+                    counts[i] += v
+                # Track clean vs flagged per file here, in O(1), rather
+                # than rescanning (and deduplicating) the rows afterwards.
+                if row[1] or row[2]:
+                    counts[issues_idx] += 1
+                details_rows.append(row)
+
+    summary = dict(zip(_SUMMARY_KEYS, counts))
 
     out_dir.mkdir(parents=True, exist_ok=True)
     # Write summary JSON
-    (out_dir / "quality_summary.json").write_text(
-        json.dumps(summary, indent=2, sort_keys=True), encoding="utf-8"
-    )
-    # Write CSV of issues
-    with (out_dir / "quality_issues.csv").open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=["file", "issues", "error"])
-        w.writeheader()
-        for row in details_rows:
-            if "error" not in row:
-                row["error"] = ""
-            w.writerow(row)
+    if orjson is not None:
+        (out_dir / "quality_summary.json").write_bytes(
+            orjson.dumps(summary, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+        )
+    else:
+        (out_dir / "quality_summary.json").write_text(
+            json.dumps(summary, indent=2, sort_keys=True), encoding="utf-8"
+        )
+    # Write CSV of issues: one buffered writerows call instead of
+    # per-row DictWriter dispatch.
+    with (out_dir / "quality_issues.csv").open(
+        "w", newline="", encoding="utf-8", buffering=1 << 20
+    ) as f:
+        w = csv.writer(f)
+        w.writerow(("file", "issues", "error"))
+        w.writerows(details_rows)
 
     return summary
 
@@ -241,6 +357,10 @@ def main():
     print("Audit complete. Summary:")
     for k in sorted(summary.keys()):
         print(f"  {k}: {summary[k]}")
+    total = summary["total_files"]
+    if total:
+        rate = (total - summary["files_with_issues"]) / total * 100
+        print(f"  success_rate: {rate:.1f}%")
 
 
 if __name__ == "__main__":
@@ -4,6 +4,39 @@ Front-matter author extractor with support for various formats and edge cases.
 import re
 from typing import List, Dict, Any, Optional
 
+# Author patterns, compiled once at import so hot loops skip the regex
+# cache lookup on every call.
+# Pattern 1: Names with superscript markers (common in papers)
+# e.g., "John Smith1,2, Jane Doe2,3"
+_PATTERN1 = re.compile(r'([A-Z][a-z]+(?:\s+[A-Z]\.?)?(?:\s+[A-Z][a-z]+)+)(?:\d+[,\d]*)?(?:,|\s+and\s+|\s*$)')
+# Pattern 2: Standard name format
+# e.g., "John A. Smith" or "John Smith"
+_PATTERN2 = re.compile(r'([A-Z][a-z]+(?:\s+[A-Z]\.?)*\s+[A-Z][a-z]+(?:\s+(?:Jr\.|Sr\.|III|IV|MD|PhD|PhD))?)')
+# Pattern 3: Names in a line after an "Authors:" style header
+_AUTHORS_HEADER = re.compile(r'Authors?:?\s*(.+?)(?:\n|\.|Abstract|Introduction|$)', re.IGNORECASE)
+_AUTHOR_SPLIT_RE = re.compile(r'[,;]|\s+and\s+')
+
+# clean_author_name patterns
+_SUPER_RE = re.compile(r'[\d†‡§¶*]+')   # superscript numbers and markers
+_EMAIL_RE = re.compile(r'\S+@\S+')      # email addresses
+_PARENS_RE = re.compile(r'\([^)]+\)')   # institutional affiliations
+
+# Stop collecting pattern-matched names past this point; front matter with
+# more hits than this is almost always a mis-detected reference list.
+_MAX_AUTHORS = 8
+
+# Keywords that indicate a candidate string is not a person's name, fused
+# into one alternation so validation scans each name once in C.
+_NON_NAME_RE = re.compile(
+    r'university|hospital|institute|department|college'
+    r'|abstract|introduction|keywords|correspondence'
+    r'|received|accepted|published|doi|copyright')
+
+# Deletes ASCII non-letters; what survives translate() is the letter count
+# for ASCII names, without a per-character Python loop.
+_NON_ALPHA_DEL = str.maketrans(
+    '', '', ''.join(chr(i) for i in range(128) if not chr(i).isalpha()))
+
 def extract_authors_from_frontmatter(doc: Dict[str, Any]) -> List[str]:
     """
     Extract authors from document front matter when metadata.authors is empty.
@@ -65,45 +98,40 @@ def extract_authors_from_text(text: str) -> List[str]:
     Extract author names from text using various patterns.
     """
     authors = []
-    
-    # Pattern 1: Names with superscript markers (common in papers)
-    # e.g., "John Smith1,2, Jane Doe2,3"
-    pattern1 = r'([A-Z][a-z]+(?:\s+[A-Z]\.?)?(?:\s+[A-Z][a-z]+)+)(?:\d+[,\d]*)?(?:,|\s+and\s+|\s*$)'
-    
-    # Pattern 2: Standard name format
-    # e.g., "John A. Smith" or "John Smith"
-    pattern2 = r'([A-Z][a-z]+(?:\s+[A-Z]\.?)*\s+[A-Z][a-z]+(?:\s+(?:Jr\.|Sr\.|III|IV|MD|PhD|PhD))?)'
-    
-    # Pattern 3: Names in a line (often after "Authors:" or similar)
+
+    # Names in a line (often after "Authors:" or similar)
     if 'author' in text.lower()[:100]:
-        # Look for text after "Authors:" or similar
-        author_match = re.search(r'Authors?:?\s*(.+?)(?:\n|\.|Abstract|Introduction|$)', text, re.IGNORECASE)
+        author_match = _AUTHORS_HEADER.search(text)
         if author_match:
             author_text = author_match.group(1)
             # Split by common delimiters
-            potential_authors = re.split(r'[,;]|\s+and\s+', author_text)
+            potential_authors = _AUTHOR_SPLIT_RE.split(author_text)
             for name in potential_authors:
                 name = clean_author_name(name)
                 if is_valid_author_name(name):
                     authors.append(name)
-    
-    # Try pattern matching if no authors found yet
+
+    # Try pattern matching if no authors found yet. Passing pos/endpos
+    # scans the first 1000 chars in place instead of allocating a slice,
+    # and author lists past _MAX_AUTHORS are noise, so stop there.
     if not authors:
         # Look for pattern1 style names
-        matches = re.finditer(pattern1, text[:1000])  # Check first 1000 chars
-        for match in matches:
+        for match in _PATTERN1.finditer(text, 0, 1000):
             name = match.group(1)
             if is_valid_author_name(name):
                 authors.append(name)
-        
+                if len(authors) >= _MAX_AUTHORS:
+                    break
+
         # If still no authors, try pattern2
         if not authors:
-            matches = re.finditer(pattern2, text[:1000])
-            for match in matches:
+            for match in _PATTERN2.finditer(text, 0, 1000):
                 name = match.group(1)
                 if is_valid_author_name(name):
                     authors.append(name)
-    
+                    if len(authors) >= _MAX_AUTHORS:
+                        break
+
     return authors
 
 def clean_author_name(name: str) -> str:
@@ -114,13 +142,13 @@ def clean_author_name(name: str) -> str:
         return ""
     
     # Remove superscript numbers and markers
-    name = re.sub(r'[\d†‡§¶*]+', '', name)
-    
+    name = _SUPER_RE.sub('', name)
+
     # Remove email addresses
-    name = re.sub(r'\S+@\S+', '', name)
-    
+    name = _EMAIL_RE.sub('', name)
+
     # Remove institutional affiliations in parentheses
-    name = re.sub(r'\([^)]+\)', '', name)
+    name = _PARENS_RE.sub('', name)
     
     # Remove common noise words if they're alone
     noise = ['and', 'et', 'al', 'corresponding', 'author', 'authors']
@@ -153,18 +181,17 @@ def is_valid_author_name(name: str) -> bool:
         return False
     
     # Should not contain certain keywords that indicate it's not a name
-    non_name_keywords = [
-        'university', 'hospital', 'institute', 'department', 'college',
-        'abstract', 'introduction', 'keywords', 'correspondence',
-        'received', 'accepted', 'published', 'doi', 'copyright'
-    ]
-    name_lower = name.lower()
-    if any(keyword in name_lower for keyword in non_name_keywords):
+    if _NON_NAME_RE.search(name.lower()):
         return False
-    
-    # Must contain mostly letters
-    letter_ratio = sum(1 for c in name if c.isalpha()) / len(name)
-    if letter_ratio < 0.7:
+
+    # Must contain mostly letters. ASCII names (the common case) count
+    # letters via translate in C; anything else keeps the exact per-char
+    # check so accented and non-Latin letters still count as letters.
+    if name.isascii():
+        alpha = len(name.translate(_NON_ALPHA_DEL))
+    else:
+        alpha = sum(1 for c in name if c.isalpha())
+    if alpha / len(name) < 0.7:
         return False
-    
+
     return True
\ No newline at end of file
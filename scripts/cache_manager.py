@@ -1,35 +1,151 @@
-import hashlib, pickle
+import hashlib, json, sqlite3
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Optional, Dict
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import lmdb
+except ImportError:
+    lmdb = None
+
+try:
+    from blake3 import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+
+def _hexdigest(data: bytes) -> str:
+    """Fast non-cryptographic digest for cache keys.
+
+    Prefers blake3 (vectorized), then xxh3; falls back to stdlib blake2b.
+    Nothing here needs collision resistance against an adversary, so the
+    fastest available hash wins. Keeps stored keys short and bounded no
+    matter how long the cached term is.
+    """
+    if blake3 is not None:
+        return blake3(data).hexdigest(length=16)
+    if xxhash is not None:
+        return xxhash.xxh3_128_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value).encode()
+
+
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class CacheManager:
+    """Single-file key-value cache for JSON-shaped lookup results.
+
+    One .pkl file per UMLS term meant every set() paid open+write+close
+    plus an inode; directory scans dominated on cache-heavy runs. Entries
+    now live in one store - LMDB when installed, else stdlib SQLite in
+    WAL mode - serialized as JSON (orjson when available) and
+    zstd-compressed when zstandard is installed.
+    """
+
+    # Bound on the in-process memo; UMLS results are small dicts, so even
+    # the full bound stays well under typical memory budgets.
+    _MEM_MAX = 100_000
+
     def __init__(self, cache_dir: Path = Path("cache")):
         self.cache_dir = cache_dir
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # In-memory LRU in front of the store: repeated terms within one
+        # run answer from memory with zero syscalls. Misses are memoized
+        # too (as None); set() overwrites them, so they never go stale.
+        self._mem: "OrderedDict[str, Any]" = OrderedDict()
+        if zstandard is not None:
+            self._compress = zstandard.ZstdCompressor(level=1).compress
+            self._decompress = zstandard.ZstdDecompressor().decompress
+        else:
+            self._compress = self._decompress = None
+        if lmdb is not None:
+            self._env = lmdb.open(
+                str(self.cache_dir / "cache.lmdb"),
+                map_size=1 << 34, subdir=False, sync=False, writemap=True,
+            )
+            self._db = None
+        else:
+            self._env = None
+            self._db = sqlite3.connect(self.cache_dir / "cache.sqlite3")
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB)"
+            )
 
     def _get_key(self, prefix: str, content: str) -> str:
-        # Clean content to avoid filesystem issues
-        clean_content = content.strip()
-        return f"{prefix}_{hashlib.md5(clean_content.encode()).hexdigest()}"
+        return f"{prefix}_{content.strip()}"
+
+    def _mem_put(self, key: str, value: Any) -> None:
+        self._mem[key] = value
+        self._mem.move_to_end(key)
+        if len(self._mem) > self._MEM_MAX:
+            self._mem.popitem(last=False)
 
     def get(self, key: str) -> Optional[Any]:
-        # Sanitize key for filesystem
-        safe_key = hashlib.md5(key.encode()).hexdigest()
-        p = self.cache_dir / f"{safe_key}.pkl"
-        if p.exists():
-            with open(p, "rb") as f:
-                return pickle.load(f)
-        return None
+        if key in self._mem:
+            self._mem.move_to_end(key)
+            return self._mem[key]
+        safe_key = _hexdigest(key.encode())
+        if self._env is not None:
+            with self._env.begin() as tx:
+                data = tx.get(safe_key.encode())
+        else:
+            row = self._db.execute(
+                "SELECT value FROM cache WHERE key = ?", (safe_key,)
+            ).fetchone()
+            data = row[0] if row else None
+        if data is None:
+            value = None
+        else:
+            if self._decompress is not None:
+                data = self._decompress(data)
+            value = _loads(bytes(data))
+        self._mem_put(key, value)
+        return value
 
     def set(self, key: str, value: Any) -> None:
-        # Sanitize key for filesystem
-        safe_key = hashlib.md5(key.encode()).hexdigest()
-        p = self.cache_dir / f"{safe_key}.pkl"
-        with open(p, "wb") as f:
-            pickle.dump(value, f)
+        safe_key = _hexdigest(key.encode())
+        data = _dumps(value)
+        if self._compress is not None:
+            data = self._compress(data)
+        if self._env is not None:
+            with self._env.begin(write=True) as tx:
+                tx.put(safe_key.encode(), data)
+        else:
+            self._db.execute(
+                "INSERT OR REPLACE INTO cache (key, value) VALUES (?, ?)",
+                (safe_key, data),
+            )
+            self._db.commit()
+        self._mem_put(key, value)
 
     def cache_umls_lookup(self, term: str, result: Dict) -> None:
         self.set(self._get_key("umls", term), result)
 
     def get_umls_lookup(self, term: str) -> Optional[Dict]:
-        return self.get(self._get_key("umls", term))
\ No newline at end of file
+        return self.get(self._get_key("umls", term))
@@ -5,6 +5,36 @@ Handles supplementary numbering, multi-page layouts, and footnotes.
 import re
 from typing import Dict, List, Any, Optional, Tuple
 
+# Caption patterns - more flexible to catch various formats. Compiled once
+# at import; the per-call re.search(str_pattern) form paid a pattern-cache
+# lookup on every paragraph of every document.
+_TABLE_PATTERNS = tuple(re.compile(p, re.IGNORECASE | re.MULTILINE) for p in (
+    r'Table\s+([A-Z0-9]+(?:\.[0-9]+)?)[:\.]?\s*(.+?)(?:\n|$)',
+    r'TABLE\s+([A-Z0-9]+(?:\.[0-9]+)?)[:\.]?\s*(.+?)(?:\n|$)',
+    r'Table\s+([IVX]+)[:\.]?\s*(.+?)(?:\n|$)',  # Roman numerals
+    r'Supplementary\s+Table\s+([A-Z0-9]+)[:\.]?\s*(.+?)(?:\n|$)',
+))
+_FIGURE_PATTERNS = tuple(re.compile(p, re.IGNORECASE | re.MULTILINE) for p in (
+    r'Figure\s+([A-Z0-9]+(?:\.[0-9]+)?)[:\.]?\s*(.+?)(?:\n|$)',
+    r'FIGURE\s+([A-Z0-9]+(?:\.[0-9]+)?)[:\.]?\s*(.+?)(?:\n|$)',
+    r'Fig\.\s+([A-Z0-9]+(?:\.[0-9]+)?)[:\.]?\s*(.+?)(?:\n|$)',
+    r'Figure\s+([IVX]+)[:\.]?\s*(.+?)(?:\n|$)',  # Roman numerals
+    r'Supplementary\s+Figure\s+([A-Z0-9]+)[:\.]?\s*(.+?)(?:\n|$)',
+))
+
+# Common footnote markers (asterisk, dagger, double dagger, letter, Note:,
+# Abbreviations:) fused into one alternation: a paragraph is scanned once
+# instead of once per marker style.
+_FOOTNOTES_RE = re.compile(
+    r'^(?:\*+\s*(?P<a>.+?)'
+    r'|†+\s*(?P<b>.+?)'
+    r'|‡+\s*(?P<c>.+?)'
+    r'|[a-z]\s*(?P<d>.+?)'
+    r'|Note:\s*(?P<e>.+?)'
+    r'|Abbreviations:\s*(?P<f>.+?))(?:\n|$)',
+    re.MULTILINE,
+)
+
 def link_captions(doc: Dict[str, Any]) -> Dict[str, Any]:
     """
     Link captions and footnotes to tables and figures in the document.
@@ -17,7 +47,13 @@ def link_captions(doc: Dict[str, Any]) -> Dict[str, Any]:
     
     # Merge tables and figures into assets
     assets = doc['assets']
-    
+
+    # One pass over the paragraphs collects every caption and footnote
+    # candidate; each asset then scores against that shortlist instead of
+    # re-scanning section x paragraph x pattern per table and figure.
+    caption_cands = _collect_caption_candidates(doc)
+    footnote_cands = _collect_footnote_candidates(doc)
+
     # Process tables
     if 'structure' in doc and 'tables' in doc['structure']:
         if 'tables' not in assets:
@@ -36,12 +72,12 @@ def link_captions(doc: Dict[str, Any]) -> Dict[str, Any]:
                 asset_table['captions'].append(table['caption'])
             
             # Look for caption in nearby text
-            caption = find_caption_for_asset(doc, table, 'table')
+            caption = find_caption_for_asset(doc, table, 'table', caption_cands['table'])
             if caption and caption not in asset_table['captions']:
                 asset_table['captions'].append(caption)
-            
+
             # Look for footnotes
-            footnotes = find_footnotes_for_asset(doc, table)
+            footnotes = find_footnotes_for_asset(doc, table, footnote_cands)
             asset_table['footnotes'].extend(footnotes)
             
             assets['tables'].append(asset_table)
@@ -64,40 +100,84 @@ def link_captions(doc: Dict[str, Any]) -> Dict[str, Any]:
                 asset_figure['captions'].append(figure['caption'])
             
             # Look for caption in nearby text
-            caption = find_caption_for_asset(doc, figure, 'figure')
+            caption = find_caption_for_asset(doc, figure, 'figure', caption_cands['figure'])
             if caption and caption not in asset_figure['captions']:
                 asset_figure['captions'].append(caption)
-            
+
             # Look for footnotes
-            footnotes = find_footnotes_for_asset(doc, figure)
+            footnotes = find_footnotes_for_asset(doc, figure, footnote_cands)
             asset_figure['footnotes'].extend(footnotes)
             
             assets['figures'].append(asset_figure)
     
     return doc
 
-def find_caption_for_asset(doc: Dict[str, Any], asset: Dict[str, Any], asset_type: str) -> Optional[str]:
+def _iter_paragraphs(doc: Dict[str, Any]):
+    """Yield (text, page, y) for every paragraph in the document."""
+    if 'structure' in doc and 'sections' in doc['structure']:
+        for section in doc['structure']['sections']:
+            if 'paragraphs' in section:
+                for para in section['paragraphs']:
+                    yield (
+                        para.get('text', ''),
+                        para.get('page', para.get('page_number')),
+                        para.get('y', para.get('top')),
+                    )
+
+def _collect_caption_candidates(doc: Dict[str, Any]) -> Dict[str, List[Tuple[str, Any, Any]]]:
+    """
+    Single pass over the document collecting (caption_text, page, y) for
+    every table and figure caption pattern match.
+    """
+    cands: Dict[str, List[Tuple[str, Any, Any]]] = {'table': [], 'figure': []}
+    for text, para_page, para_y in _iter_paragraphs(doc):
+        for asset_type, patterns in (('table', _TABLE_PATTERNS), ('figure', _FIGURE_PATTERNS)):
+            for pattern in patterns:
+                match = pattern.search(text)
+                if match:
+                    caption_text = match.group(2).strip()
+                    if caption_text and len(caption_text) > 5:  # Minimum length
+                        cands[asset_type].append((caption_text, para_page, para_y))
+    return cands
+
+def _collect_footnote_candidates(doc: Dict[str, Any]) -> List[Tuple[Any, str]]:
+    """Single pass collecting (page, footnote_text) footnote candidates.
+
+    Only the FIRST match of each marker style counts per paragraph, as the
+    old per-pattern re.search calls did - a multi-line footnote block
+    contributes one entry per style, not one per line, which also keeps
+    the noisy lowercase-letter style bounded to one hit per paragraph.
+    The branch first-characters are disjoint, so the first fused match per
+    group equals what each pattern would have found searching alone.
+    """
+    cands: List[Tuple[Any, str]] = []
+    for text, para_page, _para_y in _iter_paragraphs(doc):
+        first: Dict[str, str] = {}
+        for match in _FOOTNOTES_RE.finditer(text):
+            name = match.lastgroup
+            if name not in first:
+                first[name] = match.group(name)
+                if len(first) == 6:
+                    break
+        # Emit in marker-style order, matching the old pattern-list order.
+        for name in ("a", "b", "c", "d", "e", "f"):
+            footnote_text = first.get(name, "").strip()
+            if footnote_text and len(footnote_text) > 10:  # Avoid tiny matches
+                cands.append((para_page, footnote_text))
+    return cands
+
+def find_caption_for_asset(doc: Dict[str, Any], asset: Dict[str, Any], asset_type: str,
+                           candidates: Optional[List[Tuple[str, Any, Any]]] = None) -> Optional[str]:
     """
     Find caption for a table or figure using proximity and pattern matching.
     Enhanced with layout-aware heuristics.
+
+    candidates is the precollected list from _collect_caption_candidates;
+    standalone callers can omit it and pay for a fresh document scan.
     """
-    # Caption patterns - more flexible to catch various formats
-    if asset_type == 'table':
-        patterns = [
-            r'Table\s+([A-Z0-9]+(?:\.[0-9]+)?)[:\.]?\s*(.+?)(?:\n|$)',
-            r'TABLE\s+([A-Z0-9]+(?:\.[0-9]+)?)[:\.]?\s*(.+?)(?:\n|$)',
-            r'Table\s+([IVX]+)[:\.]?\s*(.+?)(?:\n|$)',  # Roman numerals
-            r'Supplementary\s+Table\s+([A-Z0-9]+)[:\.]?\s*(.+?)(?:\n|$)'
-        ]
-    else:  # figure
-        patterns = [
-            r'Figure\s+([A-Z0-9]+(?:\.[0-9]+)?)[:\.]?\s*(.+?)(?:\n|$)',
-            r'FIGURE\s+([A-Z0-9]+(?:\.[0-9]+)?)[:\.]?\s*(.+?)(?:\n|$)',
-            r'Fig\.\s+([A-Z0-9]+(?:\.[0-9]+)?)[:\.]?\s*(.+?)(?:\n|$)',
-            r'Figure\s+([IVX]+)[:\.]?\s*(.+?)(?:\n|$)',  # Roman numerals
-            r'Supplementary\s+Figure\s+([A-Z0-9]+)[:\.]?\s*(.+?)(?:\n|$)'
-        ]
-    
+    if candidates is None:
+        candidates = _collect_caption_candidates(doc)[asset_type]
+
     # Get page number and position if available
     page_num = asset.get('page', asset.get('page_number'))
     bbox = asset.get('bbox', asset.get('bounding_box'))
@@ -111,63 +191,40 @@ def find_caption_for_asset(doc: Dict[str, Any], asset: Dict[str, Any], asset_typ
     
     # Collect potential captions with scores
     caption_candidates = []
-    
-    # Search for captions in the document structure
-    if 'structure' in doc and 'sections' in doc['structure']:
-        for section in doc['structure']['sections']:
-            if 'paragraphs' in section:
-                for para in section['paragraphs']:
-                    text = para.get('text', '')
-                    para_page = para.get('page', para.get('page_number'))
-                    para_y = para.get('y', para.get('top'))
-                    
-                    for pattern in patterns:
-                        match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
-                        if match:
-                            caption_text = match.group(2).strip()
-                            if caption_text and len(caption_text) > 5:  # Minimum length
-                                score = 0
-                                
-                                # Score based on page proximity
-                                if page_num and para_page:
-                                    page_diff = abs(page_num - para_page)
-                                    if page_diff == 0:
-                                        score += 10  # Same page
-                                    elif page_diff == 1:
-                                        score += 5   # Adjacent page
-                                    else:
-                                        continue  # Too far
-                                
-                                # Score based on vertical position
-                                if y_pos and para_y:
-                                    y_diff = abs(y_pos - para_y)
-                                    if y_diff < 50:  # Very close
-                                        score += 8
-                                    elif y_diff < 100:  # Close
-                                        score += 4
-                                    elif y_diff < 200:  # Moderate distance
-                                        score += 2
-                                
-                                # Bonus for caption appearing after the asset
-                                if para_y and y_pos and para_y > y_pos:
-                                    score += 3  # Captions usually below figures/tables
-                                
-                                caption_candidates.append((caption_text, score))
-    
-    # Fallback: Search in paragraphs without position info
+
+    for caption_text, para_page, para_y in candidates:
+        score = 0
+
+        # Score based on page proximity
+        if page_num and para_page:
+            page_diff = abs(page_num - para_page)
+            if page_diff == 0:
+                score += 10  # Same page
+            elif page_diff == 1:
+                score += 5   # Adjacent page
+            else:
+                continue  # Too far
+
+        # Score based on vertical position
+        if y_pos and para_y:
+            y_diff = abs(y_pos - para_y)
+            if y_diff < 50:  # Very close
+                score += 8
+            elif y_diff < 100:  # Close
+                score += 4
+            elif y_diff < 200:  # Moderate distance
+                score += 2
+
+        # Bonus for caption appearing after the asset
+        if para_y and y_pos and para_y > y_pos:
+            score += 3  # Captions usually below figures/tables
+
+        caption_candidates.append((caption_text, score))
+
+    # Fallback: accept all candidates regardless of page proximity
     if not caption_candidates:
-        if 'structure' in doc and 'sections' in doc['structure']:
-            for section in doc['structure']['sections']:
-                if 'paragraphs' in section:
-                    for para in section['paragraphs']:
-                        text = para.get('text', '')
-                        for pattern in patterns:
-                            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
-                            if match:
-                                caption_text = match.group(2).strip()
-                                if caption_text and len(caption_text) > 5:
-                                    caption_candidates.append((caption_text, 1))
-    
+        caption_candidates = [(caption_text, 1) for caption_text, _, _ in candidates]
+
     # Return best scoring caption
     if caption_candidates:
         caption_candidates.sort(key=lambda x: x[1], reverse=True)
@@ -175,43 +232,27 @@ def find_caption_for_asset(doc: Dict[str, Any], asset: Dict[str, Any], asset_typ
     
     return None
 
-def find_footnotes_for_asset(doc: Dict[str, Any], asset: Dict[str, Any]) -> List[str]:
+def find_footnotes_for_asset(doc: Dict[str, Any], asset: Dict[str, Any],
+                             candidates: Optional[List[Tuple[Any, str]]] = None) -> List[str]:
     """
     Find footnotes associated with a table or figure.
+
+    candidates is the precollected list from _collect_footnote_candidates;
+    standalone callers can omit it and pay for a fresh document scan.
     """
-    footnotes = []
-    
-    # Common footnote patterns
-    footnote_patterns = [
-        r'^\*+\s*(.+?)(?:\n|$)',  # Asterisk footnotes
-        r'^†+\s*(.+?)(?:\n|$)',   # Dagger footnotes
-        r'^‡+\s*(.+?)(?:\n|$)',   # Double dagger
-        r'^[a-z]\s*(.+?)(?:\n|$)', # Letter footnotes
-        r'^Note:\s*(.+?)(?:\n|$)', # Note footnotes
-        r'^Abbreviations:\s*(.+?)(?:\n|$)'  # Abbreviations
-    ]
-    
+    if candidates is None:
+        candidates = _collect_footnote_candidates(doc)
+
     # Get page number if available
     page_num = asset.get('page', asset.get('page_number'))
-    
-    # Search for footnotes near the asset
-    if 'structure' in doc and 'sections' in doc['structure']:
-        for section in doc['structure']['sections']:
-            if 'paragraphs' in section:
-                for para in section['paragraphs']:
-                    text = para.get('text', '')
-                    # Check if this paragraph might be on the same or next page
-                    para_page = para.get('page', para.get('page_number'))
-                    if para_page and page_num and abs(para_page - page_num) > 1:
-                        continue
-                    
-                    for pattern in footnote_patterns:
-                        match = re.search(pattern, text, re.MULTILINE)
-                        if match:
-                            footnote_text = match.group(1).strip()
-                            if footnote_text and len(footnote_text) > 10:  # Avoid tiny matches
-                                footnotes.append(footnote_text)
-    
+
+    # Keep footnotes on the same or an adjacent page
+    footnotes = []
+    for para_page, footnote_text in candidates:
+        if para_page and page_num and abs(para_page - page_num) > 1:
+            continue
+        footnotes.append(footnote_text)
+
     return footnotes
 
 def classify_asset_type(asset: Dict[str, Any]) -> str:
@@ -1,9 +1,22 @@
 #!/usr/bin/env python3
 from __future__ import annotations
-import json, re, math, argparse, uuid
+import bisect, glob, json, os, re, math, argparse, uuid
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import List, Dict, Any, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pysbd
+except ImportError:
+    pysbd = None
+
 # -----------------------
 # Helpers
 # -----------------------
@@ -13,15 +26,51 @@ HEADING_STOP = {
   "supplementary","funding","copyright"
 }
 
+# Compiled once; runs per paragraph, where the per-call pattern-cache
+# lookup inside re.sub/re.split is measurable.
+_XREF_RX = re.compile(r'\b(Figure|Fig\.|Table)\s+(\d+[A-Za-z]?)\b', re.I)
+
+# Opt-in higher-quality splitter: set CHUNKER_SENT_SPLITTER=pysbd (with
+# pysbd installed) to segment with it instead of the built-in scanner.
+# Off by default so chunk boundaries stay stable across environments.
+_PYSBD_SEG = None
+if pysbd is not None and os.environ.get("CHUNKER_SENT_SPLITTER") == "pysbd":
+    _PYSBD_SEG = pysbd.Segmenter(language="en", clean=False)
+
 def sent_split(text: str) -> List[str]:
     # conservative sentence split
-    text = re.sub(r"\s+", " ", text).strip()
+    text = normalize_whitespace(text)
     if not text: return []
-    parts = re.split(r"(?<=[\.\?\!])\s+(?=[A-Z\(])", text)
-    return [s.strip() for s in parts if s.strip()]
+    if _PYSBD_SEG is not None:
+        return [s.strip() for s in _PYSBD_SEG.segment(text) if s.strip()]
+    # Linear scan instead of a lookbehind/lookahead regex: after
+    # normalize_whitespace every whitespace run is a single space, so a
+    # boundary is exactly <.?!><space><A-Z or (>. str.find walks the
+    # string in C and the worst case (no boundaries at all, e.g. OCR
+    # noise) stays O(n) with no backtracking.
+    parts = []
+    start = 0
+    pos = text.find(" ")
+    while pos != -1:
+        nxt = text[pos + 1]
+        if text[pos - 1] in ".?!" and ("A" <= nxt <= "Z" or nxt == "("):
+            parts.append(text[start:pos])
+            start = pos + 1
+        pos = text.find(" ", pos + 1)
+    parts.append(text[start:])
+    return parts
 
 def word_count(s: str) -> int:
-    return 0 if not s else len(s.split())
+    # Every caller feeds normalize_whitespace/sent_split output, where a
+    # single space delimits words; counting spaces in C beats allocating
+    # a throwaway list of substrings per sentence.
+    return 0 if not s else s.count(" ") + 1
+
+def _iter_sentences(paras: List[str]):
+    """Yield (sentence, token_count) pairs paragraph by paragraph."""
+    for p in paras:
+        for s in sent_split(p):
+            yield s, approx_tokens(s)
 
 def approx_tokens(s: str) -> int:
     # rough: 1 token ~= 1.3 words for scientific prose
@@ -40,7 +89,9 @@ def section_is_boilerplate(title: str) -> bool:
     return False
 
 def normalize_whitespace(s: str) -> str:
-    return re.sub(r"\s+", " ", s or "").strip()
+    # No-arg split() tokenizes on any whitespace run in one C pass, so
+    # split+join collapses and strips faster than a regex substitution.
+    return " ".join(s.split()) if s else ""
 
 # -----------------------
 # Stats extraction on text (optional reinforcement)
@@ -54,9 +105,17 @@ STAT_RX = {
   "rr":      re.compile(r'\bRR\s*[:=]\s*([0-9]+(?:\.[0-9]+)?)\b')
 }
 
+# Required literal per pattern: a C-level substring test screens out whole
+# scans for chunks that cannot contain that stat (most chunks, for most
+# kinds). p_value and ci_95 have no usable literal anchor.
+_STAT_PREFILTER = {"hr": "HR", "or": "OR", "rr": "RR"}
+
 def find_stats_spans(text: str) -> List[Dict[str,Any]]:
     out = []
     for kind, rx in STAT_RX.items():
+        lit = _STAT_PREFILTER.get(kind)
+        if lit is not None and lit not in text:
+            continue
         for m in rx.finditer(text):
             out.append({"kind": kind, "start": m.start(), "end": m.end(), "value": m.group(0)})
     return sorted(out, key=lambda x: x["start"])
@@ -80,18 +139,28 @@ def build_text_chunks(struct: Dict[str, Any], paper_prefix: str, target_tokens=1
 
         metrics["n_sections"] += 1
 
-        # Split paragraphs into sentences, then pack
-        sents = []
-        for p in paras:
-            sents.extend(sent_split(p))
+        # Stream sentences straight out of the paragraphs; the full
+        # per-section sentence list is never materialized. The overlap
+        # tail is pushed back in front of the stream, which reproduces
+        # the old cursor rewind exactly (the tail re-packs through the
+        # same size conditions as fresh input).
+        stream = _iter_sentences(paras)
+        pushback: deque = deque()
+
+        def _next_sent():
+            if pushback:
+                return pushback.popleft()
+            return next(stream, None)
 
         # Greedy packing
-        i = 0
-        while i < len(sents):
-            cur = []
+        item = _next_sent()
+        while item is not None:
+            cur: deque = deque()
+            cur_tok: deque = deque()
             cur_tokens = 0
-            while i < len(sents) and (cur_tokens + approx_tokens(sents[i]) <= max_tokens or not cur):
-                cur.append(sents[i]); cur_tokens += approx_tokens(sents[i]); i += 1
+            while item is not None and (cur_tokens + item[1] <= max_tokens or not cur):
+                cur.append(item[0]); cur_tok.append(item[1]); cur_tokens += item[1]
+                item = _next_sent()
                 if cur_tokens >= target_tokens: break
 
             text_block = " ".join(cur).strip()
@@ -107,17 +176,24 @@ def build_text_chunks(struct: Dict[str, Any], paper_prefix: str, target_tokens=1
                 "stats_inline": stats_spans,  # hints for UI; your doc-level stats remain authoritative
             }
             chunks.append(c)
+            # One recount of the joined block keeps the reported sizes
+            # identical (rounding differs from sum(tok) slightly).
+            block_tokens = approx_tokens(text_block)
             metrics["n_text_chunks"] += 1
-            metrics["token_sum"] += approx_tokens(text_block)
-            metrics["token_sizes"].append(approx_tokens(text_block))
-
-            # backtrack overlap in sentences for next window
-            if overlap > 0 and i < len(sents):
-                # move pointer back by ~overlap tokens (approx by sentences)
-                back = 0; t = 0
-                while back < len(cur) and t < overlap:
-                    t += approx_tokens(cur[-1 - back]); back += 1
-                i = max(0, i - back)
+            metrics["token_sum"] += block_tokens
+            metrics["token_sizes"].append(block_tokens)
+
+            # retain ~overlap tokens of window tail for the next chunk
+            if overlap > 0 and item is not None:
+                # drop from the left until only the minimal suffix
+                # totaling >= overlap tokens remains
+                while cur and cur_tokens - cur_tok[0] >= overlap:
+                    cur.popleft(); cur_tokens -= cur_tok.popleft()
+                # the retained tail precedes the lookahead sentence
+                pushback.appendleft(item)
+                for pair in zip(reversed(cur), reversed(cur_tok)):
+                    pushback.appendleft(pair)
+                item = _next_sent()
 
     return chunks, metrics
 
@@ -159,30 +235,41 @@ def build_figure_chunks(struct: Dict[str, Any], paper_prefix: str) -> List[Dict]
     return out
 
 def attach_crossrefs(text_chunks: List[Dict], table_chunks: List[Dict], figure_chunks: List[Dict]) -> None:
-    # naive index mapping by label
-    tmap = {t["label"].lower(): t["id"] for t in table_chunks}
-    fmap = {f["label"].lower(): f["id"] for f in figure_chunks}
+    # naive index mapping by label number ("Table 3" -> "3"), so the
+    # match loop looks up the captured number directly instead of
+    # rebuilding a "table {num}" string per cross-ref.
+    tmap = {t["label"].split()[-1].lower(): t["id"] for t in table_chunks}
+    fmap = {f["label"].split()[-1].lower(): f["id"] for f in figure_chunks}
 
-    rx = re.compile(r'\b(Figure|Fig\.|Table)\s+(\d+[A-Za-z]?)\b', re.I)
     for c in text_chunks:
         txt = c.get("text","")
-        linked_tables, linked_figs = set(), set()
-        for m in rx.finditer(txt):
+        # dicts double as ordered sets here: insertion dedupes, and list()
+        # at the end emits ids in mention order with no sort or set->list
+        # round trip per chunk.
+        linked_tables, linked_figs = {}, {}
+        for m in _XREF_RX.finditer(txt):
             kind = m.group(1).lower()
-            num  = m.group(2).lower()
+            # "3A" refers to a panel of Figure 3; drop the panel letter so
+            # the reference still resolves to the base asset.
+            num  = m.group(2).lower().rstrip("abcdefghijklmnopqrstuvwxyz")
             if "fig" in kind:
-                fid = fmap.get(f"figure {num}")
-                if fid: linked_figs.add(fid)
+                fid = fmap.get(num)
+                if fid: linked_figs[fid] = None
             else:
-                tid = tmap.get(f"table {num}")
-                if tid: linked_tables.add(tid)
+                tid = tmap.get(num)
+                if tid: linked_tables[tid] = None
         if linked_tables:
-            c["linked_tables"] = sorted(list(linked_tables))
+            c["linked_tables"] = list(linked_tables)
         if linked_figs:
-            c["linked_figures"] = sorted(list(linked_figs))
+            c["linked_figures"] = list(linked_figs)
 
 def build_stats_microchunks(stats: List[Dict[str,Any]], full_text: str, paper_prefix: str, window_sents=2) -> List[Dict]:
     if not stats or not full_text: return []
+    # Only stats carrying spans need the sentence map; skip the full-text
+    # split (a second whole-document normalization pass) when none do.
+    span_stats = [st for st in stats
+                  if isinstance(st, dict) and "start" in st and "end" in st]
+    if not span_stats: return []
     sents = sent_split(full_text)
     # build char offsets of sentence boundaries
     offsets = []
@@ -193,17 +280,18 @@ def build_stats_microchunks(stats: List[Dict[str,Any]], full_text: str, paper_pr
         end = start + len(s)
         offsets.append((start, end))
         pos = end
+    # Sentence spans are monotonic, so the containing sentence is the
+    # first whose end reaches the stat - found by bisect in O(log N)
+    # instead of a linear scan per stat.
+    ends = [b for _, b in offsets]
 
     out = []
-    for st in stats:
-        if not isinstance(st, dict) or "start" not in st or "end" not in st:
-            # skip doc-level stats without spans; you can still keep them at doc root
-            continue
+    for st in span_stats:
         # find sentence containing the stat
         span_mid = (st["start"] + st["end"]) // 2
-        idx = 0
-        for i,(a,b) in enumerate(offsets):
-            if a <= span_mid <= b: idx = i; break
+        idx = bisect.bisect_left(ends, span_mid)
+        if idx >= len(offsets) or offsets[idx][0] > span_mid:
+            idx = 0  # no sentence contains the span; same fallback as before
         i0 = max(0, idx - window_sents)
         i1 = min(len(sents), idx + window_sents + 1)
         ctx = " ".join(sents[i0:i1]).strip()
@@ -217,7 +305,11 @@ def build_stats_microchunks(stats: List[Dict[str,Any]], full_text: str, paper_pr
     return out
 
 def compute_report(all_chunks: List[Dict], text_metrics: Dict) -> Dict:
-    sizes = [approx_tokens(c["text"]) for c in all_chunks if c["type"] == "text" and c.get("text")]
+    # build_text_chunks already counted every text block; reuse those
+    # counts instead of re-splitting each chunk's joined text here.
+    sizes = text_metrics.get("token_sizes")
+    if sizes is None:
+        sizes = [approx_tokens(c["text"]) for c in all_chunks if c["type"] == "text" and c.get("text")]
     avg = (sum(sizes)/len(sizes)) if sizes else 0
     stdev = ( (sum((x-avg)**2 for x in sizes)/(len(sizes)-1))**0.5 ) if len(sizes) > 1 else 0
     return {
@@ -232,44 +324,51 @@ def compute_report(all_chunks: List[Dict], text_metrics: Dict) -> Dict:
 # CLI
 # -----------------------
 
-def main():
-    ap = argparse.ArgumentParser()
-    ap.add_argument("--in", dest="infile", required=True, help="Path to merged paper JSON")
-    ap.add_argument("--outdir", required=True, help="Output directory for chunks")
-    ap.add_argument("--paper_id", default=None, help="Optional paper id prefix")
-    ap.add_argument("--target_tokens", type=int, default=1000)
-    ap.add_argument("--max_tokens", type=int, default=1200)
-    ap.add_argument("--overlap_tokens", type=int, default=100)
-    args = ap.parse_args()
-
-    infile = Path(args.infile)
-    outdir = Path(args.outdir); outdir.mkdir(parents=True, exist_ok=True)
+def chunk_paper(infile: Path, outdir: Path, paper_id: str | None = None,
+                target_tokens: int = 1000, max_tokens: int = 1200,
+                overlap_tokens: int = 100) -> None:
+    """Chunk one merged paper JSON into <stem>.chunks.jsonl + report."""
+    infile = Path(infile)
+    outdir = Path(outdir); outdir.mkdir(parents=True, exist_ok=True)
     paper = json.loads(infile.read_text(encoding="utf-8"))
 
     title = paper.get("metadata",{}).get("title") or infile.stem
-    prefix = args.paper_id or f"paper:{infile.stem}"
+    prefix = paper_id or f"paper:{infile.stem}"
 
     struct = paper.get("structure", {}) or {}
     # 1) build chunks
-    text_chunks, tm = build_text_chunks(struct, prefix, args.target_tokens, args.max_tokens, args.overlap_tokens)
+    text_chunks, tm = build_text_chunks(struct, prefix, target_tokens, max_tokens, overlap_tokens)
     table_chunks    = build_table_chunks(struct, prefix)
     figure_chunks   = build_figure_chunks(struct, prefix)
 
     # 2) attach cross-refs into text
     attach_crossrefs(text_chunks, table_chunks, figure_chunks)
 
-    # 3) stats micro-chunks (if doc-level stats exist with spans)
+    # 3) stats micro-chunks (if doc-level stats exist with spans). The
+    # fulltext join only feeds the microchunks, so skip it when there are
+    # no stats at all; when there are, it must be rebuilt exactly as the
+    # upstream span coordinates expect (raw paragraphs, all sections).
     stats_doc = paper.get("statistics", [])
-    fulltext = "\n\n".join(p.get("text","") for s in struct.get("sections",[]) for p in s.get("paragraphs",[]))
+    fulltext = "\n\n".join(
+        p.get("text","") for s in struct.get("sections",[]) for p in s.get("paragraphs",[])
+    ) if stats_doc else ""
     stat_chunks = build_stats_microchunks(stats_doc, fulltext, prefix)
 
     all_chunks = text_chunks + table_chunks + figure_chunks + stat_chunks
 
-    # 4) write .jsonl
+    # 4) write .jsonl - orjson encodes straight to UTF-8 bytes; batching
+    # the lines into one buffer means a single write syscall
     chunks_path = outdir / f"{infile.stem}.chunks.jsonl"
-    with chunks_path.open("w", encoding="utf-8") as f:
+    if orjson is not None:
+        buf = bytearray()
         for c in all_chunks:
-            f.write(json.dumps(c, ensure_ascii=False) + "\n")
+            buf += orjson.dumps(c)
+            buf += b"\n"
+        chunks_path.write_bytes(buf)
+    else:
+        with chunks_path.open("w", encoding="utf-8") as f:
+            for c in all_chunks:
+                f.write(json.dumps(c, ensure_ascii=False) + "\n")
 
     # 5) small report
     report = compute_report(all_chunks, tm)
@@ -286,5 +385,36 @@ def main():
     print(f"Wrote {chunks_path} ({report['n_chunks_total']} chunks)")
     print(f"Report: {report_path}")
 
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--in", dest="infile", default=None, help="Path to merged paper JSON")
+    ap.add_argument("--in-glob", dest="in_glob", default=None,
+                    help="Glob of paper JSONs to chunk in parallel (e.g. 'in/*.json')")
+    ap.add_argument("--outdir", required=True, help="Output directory for chunks")
+    ap.add_argument("--paper_id", default=None, help="Optional paper id prefix (single-file mode only)")
+    ap.add_argument("--target_tokens", type=int, default=1000)
+    ap.add_argument("--max_tokens", type=int, default=1200)
+    ap.add_argument("--overlap_tokens", type=int, default=100)
+    args = ap.parse_args()
+
+    if bool(args.infile) == bool(args.in_glob):
+        ap.error("exactly one of --in or --in-glob is required")
+
+    if args.in_glob:
+        paths = sorted(Path(p) for p in glob.glob(args.in_glob))
+        if not paths:
+            ap.error(f"no files match {args.in_glob!r}")
+        # Papers chunk independently and the work is CPU-bound in regex;
+        # fan out one paper per task. Module-level compiled patterns are
+        # inherited by the workers, so there is no per-task setup cost.
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+            list(ex.map(chunk_paper, paths, repeat(Path(args.outdir)), repeat(None),
+                        repeat(args.target_tokens), repeat(args.max_tokens),
+                        repeat(args.overlap_tokens)))
+        print(f"Chunked {len(paths)} papers into {args.outdir}")
+    else:
+        chunk_paper(Path(args.infile), Path(args.outdir), args.paper_id,
+                    args.target_tokens, args.max_tokens, args.overlap_tokens)
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,21 +1,23 @@
 #!/usr/bin/env python3
-import json, sys
+import json, os, sys
 from pathlib import Path
 
+_GATE_ENV = {
+    'missing_doi': 'GATE_MISSING_DOI',
+    'missing_journal': 'GATE_MISSING_JOURNAL',
+    'missing_year': 'GATE_MISSING_YEAR',
+    'missing_title': 'GATE_MISSING_TITLE',
+    'empty_authors': 'GATE_EMPTY_AUTHORS',
+}
+
 def main(summary_path: str):
     s = json.loads(Path(summary_path).read_text(encoding='utf-8'))
-    gates = {
-        'missing_doi': int(os.getenv('GATE_MISSING_DOI', '0')),
-        'missing_journal': int(os.getenv('GATE_MISSING_JOURNAL', '0')),
-        'missing_year': int(os.getenv('GATE_MISSING_YEAR', '0')),
-        'missing_title': int(os.getenv('GATE_MISSING_TITLE', '0')),
-        'empty_authors': int(os.getenv('GATE_EMPTY_AUTHORS', '0')),
-    }
-    failures = []
-    for k, limit in gates.items():
-        val = int(s.get(k, 0))
-        if val > limit:
-            failures.append(f"{k}={val} > {limit}")
+    # One environ snapshot and one int() pass per side; the comparison
+    # loop is then pure int-vs-int.
+    env = os.environ
+    gates = {k: int(env.get(name, '0')) for k, name in _GATE_ENV.items()}
+    vals = {k: int(s.get(k, 0)) for k in gates}
+    failures = [f"{k}={vals[k]} > {gates[k]}" for k in gates if vals[k] > gates[k]]
     if failures:
         print('CI gate failed:', ', '.join(failures))
         sys.exit(1)
@@ -23,9 +25,7 @@ def main(summary_path: str):
     return 0
 
 if __name__ == '__main__':
-    import os
     if len(sys.argv) < 2:
         print('Usage: ci_gate.py out/reports_ci/quality_summary.json')
         sys.exit(2)
     sys.exit(main(sys.argv[1]))
-
@@ -1,9 +1,19 @@
 #!/usr/bin/env python3
 import argparse
 import json
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Quick sniff for metadata-style files: a doi string literal near the head.
+_DOI_RX = re.compile(rb'"doi"\s*:\s*"([^"]+)"')
+
 
 def norm_doi(v: str | None) -> str:
     if not v:
@@ -14,20 +24,56 @@ def norm_doi(v: str | None) -> str:
     return s
 
 
+def _doi_for_file(p: Path) -> str:
+    """Extract the normalized metadata DOI from one JSON file.
+
+    Files that open with a metadata block (the layout this pipeline
+    writes) try a regex over the first 8 KB without parsing the document.
+    The hit is trusted only when it provably sits at the top level of the
+    metadata object: the search starts at metadata's opening brace, stops
+    before any "references" key, and no brace may occur between the
+    opening and the hit (a '{' would mean a nested object, such as a
+    serialized reference, that could own the doi literal; a '}' would
+    mean metadata already closed). Anything else - including metadata
+    whose own doi is null or absent - falls back to a full orjson/json
+    parse, so a paper can never inherit a cited reference's DOI.
+    """
+    try:
+        data = p.read_bytes()
+    except OSError:
+        return ""
+    mkey = data[:512].find(b'"metadata"')
+    if mkey >= 0:
+        mopen = data.find(b"{", mkey)
+        if mopen >= 0:
+            end = 8192
+            rkey = data.find(b'"references', mopen, end)
+            if rkey >= 0:
+                end = rkey
+            m = _DOI_RX.search(data, mopen + 1, end)
+            if (m and data.find(b"{", mopen + 1, m.start()) < 0
+                    and data.find(b"}", mopen + 1, m.start()) < 0):
+                try:
+                    return norm_doi(m.group(1).decode("utf-8"))
+                except UnicodeDecodeError:
+                    pass
+    try:
+        obj = orjson.loads(data) if orjson is not None else json.loads(data)
+    except Exception:
+        return ""
+    md = (obj.get("metadata") or {}) if isinstance(obj, dict) else {}
+    return norm_doi(md.get("doi"))
+
+
 def list_duplicates(inp: Path) -> Dict[str, List[Path]]:
     by_doi: Dict[str, List[Path]] = {}
-    for p in sorted(inp.glob("*.json")):
-        if p.name == "processing_report.json":
-            continue
-        try:
-            obj = json.loads(p.read_text(encoding="utf-8"))
-        except Exception:
-            continue
-        md = obj.get("metadata") or {}
-        doi = norm_doi(md.get("doi"))
-        if not doi:
-            continue
-        by_doi.setdefault(doi, []).append(p)
+    files = [p for p in sorted(inp.glob("*.json")) if p.name != "processing_report.json"]
+    # The scan is I/O bound; threads overlap the reads. map preserves
+    # file order, so group membership order is unchanged.
+    with ThreadPoolExecutor() as ex:
+        for p, doi in zip(files, ex.map(_doi_for_file, files)):
+            if doi:
+                by_doi.setdefault(doi, []).append(p)
     return {k: v for k, v in by_doi.items() if len(v) > 1}
 
 
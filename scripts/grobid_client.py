@@ -1,5 +1,6 @@
 import httpx
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Tuple
 from .utils import robust_api_call
 
 class Grobid:
@@ -22,4 +23,16 @@ class Grobid:
             r = self.cli.post(f"{self.base}/api/processReferences",
                               files={"input": (pdf_path, f, "application/pdf")})
         r.raise_for_status()
-        return {"references_tei": r.text}
\ No newline at end of file
+        return {"references_tei": r.text}
+
+    def process_both(self, pdf_path: str) -> Tuple[Dict, Dict]:
+        """Run fulltext and biblio processing concurrently.
+
+        The two POSTs are independent and GROBID serves them on separate
+        worker threads, so overlapping them costs max() rather than sum()
+        of their latencies. httpx.Client is thread-safe.
+        """
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            fulltext = ex.submit(self.process_fulltext, pdf_path)
+            biblio = ex.submit(self.process_biblio, pdf_path)
+            return fulltext.result(), biblio.result()
\ No newline at end of file
@@ -230,7 +230,23 @@ def process_pdf(pdf_path: Path, out_json: Path, cfg_path: Path, linker: str, dum
     
     # --- write final output (guarded) ---
     safe_write_json(merged, out_json)
-    
+
+    # Sidecar with the counts the batch reporter needs, so it never has to
+    # re-parse the full document just to count authors/references/etc.
+    summary = {
+        "authors": len(merged.get("metadata", {}).get("authors", [])),
+        "abstract": bool(merged.get("metadata", {}).get("abstract")),
+        "references": len(merged.get("metadata", {}).get("references_enriched", [])),
+        "statistics": len(merged.get("statistics", [])),
+        "tables": len(merged.get("assets", {}).get("tables", [])),
+        "figures": len(merged.get("assets", {}).get("figures", [])),
+    }
+    try:
+        out_json.with_suffix(".summary.json").write_text(
+            json.dumps(summary, indent=2), encoding="utf-8")
+    except OSError as e:
+        logger.warning(f"Could not write summary sidecar: {e}")
+
     qa = {
         "pdf": pdf_path.name,
         "n_sections": len(merged.get("structure", {}).get("sections", [])),
@@ -250,17 +266,50 @@ def process_pdf(pdf_path: Path, out_json: Path, cfg_path: Path, linker: str, dum
     logger.success(f"Done → {out_json}")
 
 
+def run_worker_loop(default_cfg: str, default_linker: str):
+    """Serve (pdf, out) jobs from stdin, one JSON object per line.
+
+    Heavy imports (Docling, torch, linkers) happen once per worker process;
+    batch drivers keep this loop alive instead of paying interpreter startup
+    and model init per PDF. One JSON result line is written per job.
+    """
+    # Reserve real stdout for the job protocol; library prints go to stderr.
+    proto_out = sys.stdout
+    sys.stdout = sys.stderr
+    for line in iter(sys.stdin.readline, ""):
+        line = line.strip()
+        if not line:
+            continue
+        job = json.loads(line)
+        result = {"pdf": job.get("pdf"), "ok": False, "error": None}
+        try:
+            process_pdf(
+                Path(job["pdf"]), Path(job["out"]),
+                Path(job.get("cfg", default_cfg)),
+                linker=job.get("linker", default_linker),
+            )
+            result["ok"] = True
+        except Exception as e:
+            result["error"] = str(e)
+        proto_out.write(json.dumps(result) + "\n")
+        proto_out.flush()
+
+
 if __name__ == "__main__":
     ap = argparse.ArgumentParser()
     ap.add_argument("--pdf", required=False, help="Single PDF path")
     ap.add_argument("--out", required=False, help="Single JSON path")
     ap.add_argument("--linker", choices=["umls","scispacy","quickumls"], default="umls")
     ap.add_argument("--cfg", default="config/docling_medical_config.yaml")
+    ap.add_argument("--worker", action="store_true",
+                   help="Run as a long-lived worker reading JSON jobs from stdin")
     ap.add_argument("--dump-docling-debug", action="store_true",
                    help="Write a Docling JSON snapshot with base64 stripped (for debugging only)")
     args = ap.parse_args()
-    
-    if args.pdf and args.out:
+
+    if args.worker:
+        run_worker_loop(args.cfg, args.linker)
+    elif args.pdf and args.out:
         process_pdf(Path(args.pdf), Path(args.out), Path(args.cfg), linker=args.linker, dump_docling_debug=args.dump_docling_debug)
     else:
         print("Use run_batch.py for folder processing.")
\ No newline at end of file
@@ -94,5 +94,29 @@ def extract_statistics(text: str) -> List[Dict]:
     
     # Sort by position in text
     hits.sort(key=lambda x: x["start"])
-    
+
+    return hits
+
+
+def extract_statistics_from_paragraphs(paragraphs) -> List[Dict]:
+    """
+    Extract statistics from an iterable of paragraphs without concatenating
+    them into one big fulltext string first.
+
+    Emitted spans are paragraph-relative; each hit carries the paragraph
+    index so callers can still locate it in the source structure.
+
+    Args:
+        paragraphs: Iterable of paragraph strings
+
+    Returns:
+        List of hit dicts as in extract_statistics, plus a "paragraph" index
+    """
+    hits = []
+    for idx, para in enumerate(paragraphs):
+        if not para:
+            continue
+        for hit in extract_statistics(para):
+            hit["paragraph"] = idx
+            hits.append(hit)
     return hits
\ No newline at end of file